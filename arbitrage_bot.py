@@ -181,16 +181,11 @@ class ArbitrageBot:
 
                         bid_price, ask_price = self.standx.calculate_order_prices(current_price)
 
-                        # Place new orders
-                        bid_order = self.standx.place_order("buy", bid_price)
-                        if bid_order:
-                            self.standx.active_orders[bid_order.cl_ord_id] = bid_order
-                            self.filled_orders[bid_order.cl_ord_id] = bid_order
-
-                        ask_order = self.standx.place_order("sell", ask_price)
-                        if ask_order:
-                            self.standx.active_orders[ask_order.cl_ord_id] = ask_order
-                            self.filled_orders[ask_order.cl_ord_id] = ask_order
+                        # Place new orders (bid and ask sent together)
+                        placed = self.standx.place_orders_batch([("buy", bid_price), ("sell", ask_price)])
+                        for order in placed:
+                            self.standx.active_orders[order.cl_ord_id] = order
+                            self.filled_orders[order.cl_ord_id] = order
 
                 # Print status
                 if int(time.time()) % 60 == 0:  # Every minute
@@ -0,0 +1,37 @@
+"""
+Event loop runner shared by the bot and the test scripts
+Uses uvloop when installed (not available on Windows), stdlib asyncio otherwise
+"""
+import asyncio
+from typing import Any, Coroutine
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# True when coroutines passed to run() execute on uvloop
+USING_UVLOOP = uvloop is not None
+
+
+def run(main: Coroutine) -> Any:
+    """
+    Run a coroutine to completion on a new event loop and return its result.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's return value
+    """
+    # Python 3.11+: hand uvloop in as the loop factory (uvloop.install() relies on
+    # the event loop policy API, deprecated since 3.12)
+    if hasattr(asyncio, "Runner"):
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(main)
+
+    # Python 3.10: no Runner, install uvloop's event loop policy instead
+    if uvloop is not None:
+        uvloop.install()
+    return asyncio.run(main)
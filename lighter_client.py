@@ -180,7 +180,8 @@ class LighterHedger:
             raise
 
     async def place_hedge_order(self, side: str, quantity: Decimal,
-                               price: Optional[Decimal] = None) -> bool:
+                               price: Optional[Decimal] = None,
+                               lock_acquired: Optional[asyncio.Event] = None) -> bool:
         """
         Place a hedge order on Lighter using market order for immediate execution.
         Position is updated only after confirming the order was filled.
@@ -189,6 +190,7 @@ class LighterHedger:
             side: "buy" or "sell"
             quantity: Order quantity
             price: Reference price (not used for market orders, kept for compatibility)
+            lock_acquired: Optional event set once the hedge lock is held (lets tests order hedges)
 
         Returns:
             True if successful and position verified
@@ -201,6 +203,8 @@ class LighterHedger:
         logger.info(f"[HEDGE-LOCK] Waiting for lock: {side.upper()} {quantity} {self.ticker_symbol}")
         async with self._hedge_lock:
             logger.info(f"[HEDGE-LOCK] Lock acquired: {side.upper()} {quantity} {self.ticker_symbol}")
+            if lock_acquired is not None:
+                lock_acquired.set()
 
             try:
                 # Record position before placing order
@@ -427,42 +431,74 @@ class LighterHedger:
 
         try:
             positions = await self._fetch_positions()
-
-            # Find position for our market
-            for position in positions:
-                if position.market_id == self.market_id:
-                    pos_size = Decimal(str(position.position))
-                    self.current_position = pos_size
-                    logger.debug(f"Lighter position for market {self.market_id}: {pos_size} (raw: {position.position})")
-                    return pos_size
-
-            return Decimal('0')
+            return self._position_from(positions)
 
         except Exception as e:
             logger.error(f"Failed to get Lighter position: {e}")
             return Decimal('0')
 
+    def _position_from(self, positions) -> Decimal:
+        """Extract our market's position from a positions list and update local tracking"""
+        for position in positions:
+            if position.market_id == self.market_id:
+                pos_size = Decimal(str(position.position))
+                self.current_position = pos_size
+                logger.debug(f"Lighter position for market {self.market_id}: {pos_size} (raw: {position.position})")
+                return pos_size
+
+        return Decimal('0')
+
+    async def _fetch_account(self):
+        """Fetch our account from Lighter API (positions and balance), None if not found"""
+        account_api = lighter.AccountApi(self.api_client)
+
+        account_data = await account_api.account(
+            by="index",
+            value=str(self.account_index)
+        )
+
+        if not account_data or not account_data.accounts:
+            return None
+
+        return account_data.accounts[0]
+
     async def _fetch_positions(self):
         """Fetch positions from Lighter API"""
         try:
-            account_api = lighter.AccountApi(self.api_client)
-
-            # Get account info which includes positions
-            account_data = await account_api.account(
-                by="index",
-                value=str(self.account_index)
-            )
+            account = await self._fetch_account()
 
-            if not account_data or not account_data.accounts:
+            if account is None:
                 logger.warning("No account data or positions found")
                 return []
 
-            return account_data.accounts[0].positions
+            return account.positions
 
         except Exception as e:
             logger.error(f"Error fetching positions: {e}")
             return []
 
+    async def get_account_snapshot(self) -> Dict[str, Any]:
+        """
+        Get positions, our market's position and balance from a single account request.
+
+        Returns:
+            Dictionary with "positions" (raw list), "position" (Decimal) and "balance"
+            (same format as get_balance)
+
+        Raises:
+            Exception: If the account request fails
+        """
+        if not self.enabled:
+            return {"positions": [], "position": Decimal('0'), "balance": self._balance_from(None)}
+
+        account = await self._fetch_account()
+        positions = account.positions if account is not None else []
+        return {
+            "positions": positions,
+            "position": self._position_from(positions),
+            "balance": self._balance_from(account),
+        }
+
     async def cancel_order(self, order_id: int) -> bool:
         """
         Cancel an order by ID.
@@ -544,37 +580,34 @@ class LighterHedger:
             return {"balance": Decimal('0'), "available": Decimal('0')}
 
         try:
-            account_api = lighter.AccountApi(self.api_client)
-
-            # Get account info which includes balance
-            account_data = await account_api.account(
-                by="index",
-                value=str(self.account_index)
-            )
-
-            if account_data and account_data.accounts:
-                account = account_data.accounts[0]
-                # Get USDC balance (usually the first balance)
-                if hasattr(account, 'available_balance'):
-                    balance = Decimal(str(account.available_balance))
-                elif hasattr(account, 'balance'):
-                    balance = Decimal(str(account.balance))
-                else:
-                    # Try to get from balances array if exists
-                    balance = Decimal('0')
-                    logger.warning("Could not find balance field in account data")
-
-                return {
-                    "balance": balance,
-                    "available": balance
-                }
-
-            return {"balance": Decimal('0'), "available": Decimal('0')}
+            account = await self._fetch_account()
+            return self._balance_from(account)
 
         except Exception as e:
             logger.error(f"Failed to get Lighter balance: {e}")
             return {"balance": Decimal('0'), "available": Decimal('0')}
 
+    @staticmethod
+    def _balance_from(account) -> Dict[str, Decimal]:
+        """Extract balance information from an account object (None -> zero balance)"""
+        if account is None:
+            return {"balance": Decimal('0'), "available": Decimal('0')}
+
+        # Get USDC balance (usually the first balance)
+        if hasattr(account, 'available_balance'):
+            balance = Decimal(str(account.available_balance))
+        elif hasattr(account, 'balance'):
+            balance = Decimal(str(account.balance))
+        else:
+            # Try to get from balances array if exists
+            balance = Decimal('0')
+            logger.warning("Could not find balance field in account data")
+
+        return {
+            "balance": balance,
+            "available": balance
+        }
+
     async def disconnect(self):
         """Disconnect from Lighter"""
         try:
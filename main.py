@@ -3,13 +3,19 @@ StandX Maker Hedger - Main Controller
 Market making on StandX with Lighter hedging
 """
 import logging
+import logging.handlers
 import asyncio
+import queue
 import sys
-from decimal import Decimal
-from datetime import datetime
+import time
+from decimal import Decimal, InvalidOperation
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
 
+import event_loop
 from config_loader import get_config
-from standx_client import StandXMarketMaker
+from standx_client import StandXMarketMaker, OrderUpdate, PRICE_TICK_SCALE
 from lighter_client import LighterHedger
 from risk_manager import RiskManager
 from state_machine import StateMachine, BotState, OrderState
@@ -17,9 +23,74 @@ from state_machine import StateMachine, BotState, OrderState
 logger = logging.getLogger(__name__)
 
 
+def _to_dec(value) -> Decimal:
+    """Convert an exchange/config number to Decimal with a single parse"""
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, (int, str)):
+        return Decimal(value)
+    return Decimal(repr(value))
+
+
+def _to_ticks(value, scale: int) -> int:
+    """Convert an exchange price (str/float/Decimal) to integer ticks of 1/scale"""
+    return int(round(float(value) * scale))
+
+
+def _parse_fill(update: OrderUpdate) -> Optional[Tuple[str, str, Decimal]]:
+    """
+    Extract (order_id, side, filled_qty) from a fill event.
+
+    Returns:
+        Parsed tuple, or None (logged) if the event is malformed
+    """
+    try:
+        filled_qty = _to_dec(update.filled_qty)
+    except (TypeError, InvalidOperation) as e:
+        logger.error("Malformed fill event for order %s: %r", update.order_id, e)
+        return None
+    if update.side not in ("buy", "sell") or not filled_qty.is_finite():
+        logger.error("Malformed fill event for order %s: side=%s qty=%s",
+                     update.order_id, update.side, update.filled_qty)
+        return None
+    return update.order_id, update.side, filled_qty
+
+
+class _Usd:
+    """Price log argument: formatted with thousands separators ("97,123.40") only when emitted"""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self) -> str:
+        return "N/A" if self.value is None else format(self.value, ",.2f")
+
+
+@dataclass(slots=True)
+class _LastStatus:
+    """Last printed status snapshot, used for change detection"""
+    standx_pos: Decimal = Decimal('0')
+    lighter_pos: Decimal = Decimal('0')
+    order_count: int = 0
+    trade_count: int = 0
+    pnl: float = 0.0
+
+
 class StandXMakerHedger:
     """StandX Maker Hedger - Market making with hedging controller"""
 
+    # Minimum seconds between full tracebacks in hot-path error logs
+    EXC_TRACE_INTERVAL = 5.0
+    # Max age (seconds) of a cached ticker read within one check cycle
+    TICKER_MAX_AGE = 0.5
+    # Max age (seconds) of the position snapshot used for status output
+    STATUS_POSITION_MAX_AGE = 1.0
+    # Fills arriving within this window (seconds) are netted into a single Lighter hedge
+    HEDGE_COALESCE_WINDOW = 0.03
+    # Max fills waiting for the hedge consumer
+    FILL_QUEUE_SIZE = 256
+
     def __init__(self, config_path: str = "config.json", env_path: str = ".env"):
         """
         Initialize arbitrage bot.
@@ -52,9 +123,36 @@ class StandXMakerHedger:
         self.close_spread_pct = self.config.get("strategy.close_spread_percentage", 0.01) / 100.0
         self.close_update_threshold = self.config.get("strategy.close_order_update_threshold", 0.05) / 100.0
 
+        # Decimal forms of the ratios above, converted once from the raw config
+        # percentages (dividing as Decimal avoids float artifacts like 0.07/100)
+        self._spread_dec = _to_dec(self.config.get("trading.spread_percentage", 0.1)) / 100
+        self._threshold_dec = _to_dec(self.config.get("strategy.cancel_distance_percentage", 0.05)) / 100
+        self._close_update_threshold_dec = _to_dec(self.config.get("strategy.close_order_update_threshold", 0.05)) / 100
+
+        # Spread/threshold as exact integer ratios, so price checks are pure int tick math
+        self._spread_num, self._spread_den = self._spread_dec.as_integer_ratio()
+        self._threshold_num, self._threshold_den = self._threshold_dec.as_integer_ratio()
+        # StandX quotes are placed on whole-dollar prices
+        self._quote_step_ticks = PRICE_TICK_SCALE
+
         # State tracking
         self.running = False
         self.current_price = None
+        self._ticker_cache = (0.0, None)  # (monotonic ts, ticker dict)
+        self._ticker_lock = asyncio.Lock()  # One ticker request in flight; concurrent callers share it
+        self._status_position_cache = (0.0, None)  # (monotonic ts, (standx_pos, lighter_pos))
+
+        # Set by WebSocket order events to wake the main loop before check_interval
+        self._wake_event = asyncio.Event()
+        # Set by WebSocket cancel confirmations; only _wait_cancels_confirmed waits on it
+        self._cancel_event = asyncio.Event()
+
+        # Hedge quantity accumulated per Lighter side during the coalescing window
+        self._hedge_accum = {"buy": Decimal('0'), "sell": Decimal('0')}
+
+        # WebSocket fills are queued here and hedged by a single consumer task
+        self._fill_queue: asyncio.Queue = asyncio.Queue(maxsize=self.FILL_QUEUE_SIZE)
+        self._hedge_task = None
 
         # Close order tracking
         self.close_order_id = None  # Track the close order (real order ID from WebSocket)
@@ -63,22 +161,62 @@ class StandXMakerHedger:
         self.close_order_side = None  # Track close order side
 
         # Status tracking for smart logging
-        self.last_status = {
-            'standx_pos': 0,
-            'lighter_pos': 0,
-            'order_count': 0,
-            'trade_count': 0,
-            'pnl': 0.0
-        }
-        self.last_hourly_status_time = 0
+        self.last_status = _LastStatus()
+        self.next_hourly_status_time = 0.0  # Event-loop clock deadline for the hourly status line
 
         # Loop protection for Lighter position closing
         self.lighter_close_attempts = {}  # Track close attempts per position
         self.max_close_attempts = 10  # Maximum attempts before requiring manual intervention
         self.lighter_close_blocked = set()  # Positions that have exceeded max attempts
 
+        # Traceback sampling for hot-path error logs
+        self._last_exc_log_time = 0.0
+        self._exc_count = 0
+
         logger.info("StandX Maker Hedger initialized successfully")
 
+    def _log_error_sampled(self, message: str, e: Exception):
+        """Log an error, attaching the traceback at most once per EXC_TRACE_INTERVAL"""
+        now = time.monotonic()
+        if now - self._last_exc_log_time > self.EXC_TRACE_INTERVAL:
+            logger.error("%s: %s (suppressed=%s)", message, e, self._exc_count, exc_info=True)
+            self._last_exc_log_time = now
+            self._exc_count = 0
+        else:
+            self._exc_count += 1
+            logger.error("%s: %s", message, e)
+
+    async def _get_ticker_cached(self, max_age: float = TICKER_MAX_AGE) -> dict:
+        """Get StandX ticker, reusing the last good read if younger than max_age"""
+        ts, ticker = self._ticker_cache
+        if ticker is not None and time.monotonic() - ts < max_age:
+            return ticker
+        async with self._ticker_lock:
+            # A caller that waited on the lock finds the read the holder just cached
+            ts, ticker = self._ticker_cache
+            now = time.monotonic()
+            if ticker is not None and now - ts < max_age:
+                return ticker
+            ticker = await self.standx.fetch_ticker()
+            if ticker.get("mark_price"):
+                self._ticker_cache = (now, ticker)
+            return ticker
+
+    async def _get_status_positions(self) -> Tuple[Decimal, Decimal]:
+        """
+        Fetch StandX and Lighter positions concurrently for status output.
+        Trading logic must not use this: results may be STATUS_POSITION_MAX_AGE old.
+        """
+        ts, positions = self._status_position_cache
+        if positions is not None and time.monotonic() - ts < self.STATUS_POSITION_MAX_AGE:
+            return positions
+        positions = tuple(await asyncio.gather(
+            self.standx.get_position(),
+            self.lighter.get_position()
+        ))
+        self._status_position_cache = (time.monotonic(), positions)
+        return positions
+
     def handle_order_confirmed(self, order_id: str, cl_ord_id: str):
         """Handle order confirmed (open status) from WebSocket"""
         # Find cl_ord_id from tracked orders if not provided
@@ -89,71 +227,146 @@ class StandXMakerHedger:
                     break
         if cl_ord_id:
             self.state_machine.on_order_confirmed(cl_ord_id, order_id)
+        self._wake_event.set()
 
     def handle_order_cancelled(self, order_id: str):
         """Handle order cancelled from WebSocket"""
         self.state_machine.on_order_cancelled(order_id)
+        self._cancel_event.set()
+        self._wake_event.set()
 
-    async def handle_standx_order_fill(self, order_data: dict):
+    def handle_standx_order_fill(self, update: OrderUpdate):
         """
-        Handle StandX order fill by hedging on Lighter.
+        Handle StandX order fill from WebSocket by queueing it for the hedge consumer.
 
         Args:
-            order_data: Order fill data from WebSocket
+            update: Parsed order update of the filled order
         """
         try:
-            order_id = order_data.get("order_id")
-            side = order_data.get("side")  # "buy" or "sell"
-            filled_qty = Decimal(str(order_data.get("qty", 0)))
-            fill_price = Decimal(str(order_data.get("price", 0)))
+            self._fill_queue.put_nowait(update)
+        except asyncio.QueueFull:
+            # An unqueued fill is an unhedged position - stop rather than drift
+            logger.error("Fill queue full, dropped fill for order %s (%s %s), MANUAL INTERVENTION REQUIRED!",
+                         update.order_id, update.side, update.filled_qty)
+            self.risk_mgr.force_stop()
 
-            logger.info(f"Detected StandX fill: {side} {filled_qty}@{fill_price}")
+    def _record_fill(self, update: OrderUpdate) -> bool:
+        """
+        Apply one fill to the state machine and add its hedge to the accumulator.
 
-            # Update state machine with fill info
-            tracked_order = self.state_machine.on_order_filled(str(order_id), filled_qty)
+        Args:
+            update: Parsed order update of the filled order
 
-            # Check risk limits before hedging
-            if not self.risk_mgr.can_open_position(float(filled_qty)):
-                logger.error("Risk limits prevent hedging, MANUAL INTERVENTION REQUIRED!")
+        Returns:
+            False if risk limits prevent hedging this fill
+        """
+        parsed = _parse_fill(update)
+        if parsed is None:
+            # Unknown quantity means an unknown exposure - stop instead of guessing
+            self.risk_mgr.force_stop()
+            return False
+        order_id, side, filled_qty = parsed
+        fill_price = update.price  # Only logged
+
+        logger.info("Detected StandX fill: %s %s@%s", side, filled_qty, fill_price)
+
+        # Update state machine with fill info (no main loop wake-up: its position
+        # sync must not run while this fill's hedge is still pending)
+        self.state_machine.on_order_filled(order_id, filled_qty)
+
+        # Check risk limits before hedging
+        if not self.risk_mgr.can_open_position(float(filled_qty)):
+            logger.error("Risk limits prevent hedging, MANUAL INTERVENTION REQUIRED!")
+            self.risk_mgr.force_stop()
+            return False
+
+        # Determine hedge side (opposite of StandX fill)
+        hedge_side = "sell" if side == "buy" else "buy"
+        self._hedge_accum[hedge_side] += filled_qty
+        return True
+
+    def _hedge_pending(self) -> bool:
+        """
+        True while a fill's hedge is not settled yet: queued, accumulating in the
+        coalescing window, or being placed on Lighter. Position-based close order
+        management and hedge sync must wait, or they would hedge the same fill again.
+        """
+        if not self._fill_queue.empty() or self._hedge_accum["buy"] or self._hedge_accum["sell"]:
+            return True
+        # Without hedge_immediately, HEDGING is left for sync_hedge_positions to resolve
+        return self.hedge_immediately and self.state_machine.is_hedging()
+
+    async def _hedge_consumer(self):
+        """
+        Single consumer for queued fills. Each burst is collected for
+        HEDGE_COALESCE_WINDOW, then netted into one Lighter hedge.
+        """
+        queue = self._fill_queue
+        while True:
+            update = await queue.get()
+            try:
+                self._record_fill(update)
+
+                # Let the rest of the burst arrive, then fold in everything queued
+                await asyncio.sleep(self.HEDGE_COALESCE_WINDOW)
+                while not queue.empty():
+                    self._record_fill(queue.get_nowait())
+
+                await self._flush_hedges()
+
+            except OSError as e:
+                # Network failure (requests/socket/timeout) - expected, no traceback
+                logger.warning("Transient error handling fill: %s", e)
+                self.risk_mgr.force_stop()
+            except Exception as e:
+                self._log_error_sampled("Error handling fill", e)
                 self.risk_mgr.force_stop()
-                return
 
-            # Determine hedge side (opposite of StandX fill)
-            hedge_side = "sell" if side == "buy" else "buy"
+    async def _flush_hedges(self):
+        """
+        Net the hedge quantity accumulated during the coalescing window and place
+        a single Lighter order for it.
+        """
+        accum = self._hedge_accum
+        net = accum["buy"] - accum["sell"]
+        accum["buy"] = accum["sell"] = Decimal('0')
 
-            logger.info(f"Hedging on Lighter: {hedge_side} {filled_qty}")
+        if net == 0:
+            logger.info("Fills in hedge window offset each other, nothing to hedge")
+            return
 
-            # Transition to HEDGING state
-            self.state_machine.on_hedging_start()
+        hedge_side = "buy" if net > 0 else "sell"
+        hedge_qty = abs(net)
 
-            # Place hedge on Lighter，判断，如果有配置立即对冲，就执行对冲
-            if self.hedge_immediately:
-                success = await self.lighter.place_hedge_order(
-                    side=hedge_side,
-                    quantity=filled_qty,
-                    price=None  # Market price
-                )
+        logger.info("Hedging on Lighter: %s %s", hedge_side, hedge_qty)
 
-                if success:
-                    logger.info("Hedge placed successfully")
+        # Transition to HEDGING state
+        self.state_machine.on_hedging_start()
 
-                    # Calculate P&L (simplified - actual P&L depends on fill prices)
-                    # For now, just track that we're hedged
-                    self.risk_mgr.update_pnl(0.0)
+        # Place hedge on Lighter，判断，如果有配置立即对冲，就执行对冲
+        if self.hedge_immediately:
+            success = await self.lighter.place_hedge_order(
+                side=hedge_side,
+                quantity=hedge_qty,
+                price=None  # Market price
+            )
 
-                    # Transition to CLOSING state
-                    self.state_machine.on_hedging_complete()
+            if success:
+                logger.info("Hedge placed successfully")
 
-                    # Place close order on StandX (Maker order to close the position)
-                    # Close side is same as hedge side (opposite of original fill)
-                    await self.place_close_order(side=hedge_side, quantity=filled_qty)
-                else:
-                    logger.error("FAILED TO HEDGE! Manual intervention required!")
-                    self.risk_mgr.force_stop()
+                # Calculate P&L (simplified - actual P&L depends on fill prices)
+                # For now, just track that we're hedged
+                self.risk_mgr.update_pnl(0.0)
 
-        except Exception as e:
-            logger.error(f"Error handling fill: {e}", exc_info=True)
-            self.risk_mgr.force_stop()
+                # Transition to CLOSING state
+                self.state_machine.on_hedging_complete()
+
+                # Place close order on StandX (Maker order to close the position)
+                # Close side is same as hedge side (opposite of original fill)
+                await self.place_close_order(side=hedge_side, quantity=hedge_qty)
+            else:
+                logger.error("FAILED TO HEDGE! Manual intervention required!")
+                self.risk_mgr.force_stop()
 
     async def place_close_order(self, side: str, quantity: Decimal):
         """
@@ -165,9 +378,9 @@ class StandXMakerHedger:
         """
         try:
             # Get current ticker with bid/ask prices
-            ticker = self.standx.get_ticker()
-            best_bid = Decimal(str(ticker.get("bid_price", 0)))
-            best_ask = Decimal(str(ticker.get("ask_price", 0)))
+            ticker = await self.standx.fetch_ticker()
+            best_bid = _to_dec(ticker.get("bid_price", 0))
+            best_ask = _to_dec(ticker.get("ask_price", 0))
 
             if best_bid <= 0 or best_ask <= 0:
                 logger.error("Invalid bid/ask prices, cannot place close order")
@@ -183,7 +396,7 @@ class StandXMakerHedger:
                 # For sell close order, place at best bid plus one tick (easier to fill as Maker)
                 close_price = float(best_bid + tick_size)
 
-            logger.info(f"→ Placing CLOSE order on StandX: {side.upper()} {quantity} @ ${close_price:,.2f} (Maker)")
+            logger.info("→ Placing CLOSE order on StandX: %s %s @ $%s (Maker)", side.upper(), quantity, _Usd(close_price))
 
             # Place close order
             order = await self.standx.place_order(side, close_price, float(quantity))
@@ -196,132 +409,163 @@ class StandXMakerHedger:
                 self.state_machine.track_order(
                     cl_ord_id=order.cl_ord_id,
                     side=side,
-                    price=Decimal(str(close_price)),
+                    price=_to_dec(close_price),
                     quantity=quantity,
                     is_close_order=True
                 )
 
                 # Save cl_ord_id for tracking (real order_id will come from WebSocket)
                 self.close_order_cl_ord_id = order.cl_ord_id
-                self.close_order_price = Decimal(str(close_price))
+                self.close_order_price = _to_dec(close_price)
                 self.close_order_side = side
-                logger.info(f"✓ Close order placed: cl_ord_id={order.cl_ord_id}")
+                logger.info("✓ Close order placed: cl_ord_id=%s", order.cl_ord_id)
             else:
                 logger.error("Failed to place close order")
 
         except Exception as e:
-            logger.error(f"Error placing close order: {e}", exc_info=True)
+            logger.error("Error placing close order: %s", e, exc_info=True)
+
+    async def place_market_making_orders(self, mark_ticks: int = None):
+        """
+        Place bid and ask orders around current price.
 
-    async def place_market_making_orders(self):
-        """Place bid and ask orders around current price"""
+        Args:
+            mark_ticks: Mark price in ticks already read by the caller (fetched if None)
+        """
         try:
             # Check state machine - prevent duplicate orders
             if not self.state_machine.can_place_orders():
-                logger.debug(f"Cannot place orders in state {self.state_machine.state_name}")
+                logger.debug("Cannot place orders in state %s", self.state_machine.state_name)
                 return
 
             # Get current price
-            ticker = self.standx.get_ticker()
-            mark_price = Decimal(str(ticker.get("mark_price", 0)))
+            scale = PRICE_TICK_SCALE
+            if mark_ticks is None:
+                ticker = await self._get_ticker_cached()
+                mark_ticks = _to_ticks(ticker.get("mark_price", 0), scale)
 
-            if mark_price <= 0:
+            if mark_ticks <= 0:
                 logger.warning("Invalid mark price, skipping order placement")
                 return
 
-            self.current_price = mark_price
+            self.current_price = mark_ticks / scale
 
-            # Calculate order prices
+            # Calculate order prices in integer ticks
             # spread_pct is the TOTAL spread (e.g., 0.09 = 9 bps total)
             # Each side gets half of the spread
-            half_spread = mark_price * Decimal(str(self.spread_pct)) / Decimal('2')
+            # Round every step away from mark (bid down, ask up) so quotes never
+            # land inside the configured spread or cross the book
+            half_spread_ticks = -(-(mark_ticks * self._spread_num) // (2 * self._spread_den))
+            bid_ticks = mark_ticks - half_spread_ticks
+            ask_ticks = mark_ticks + half_spread_ticks
 
             # Round prices to integers for StandX price tick requirement
-            bid_price = float(int(mark_price - half_spread))
-            ask_price = float(int(mark_price + half_spread))
+            # (floor for bid, ceil for ask; // floors toward -inf)
+            step = self._quote_step_ticks
+            bid_ticks -= bid_ticks % step
+            ask_ticks += -ask_ticks % step
+
+            # Convert to float only at the REST boundary
+            bid_price = bid_ticks / scale
+            ask_price = ask_ticks / scale
 
             # Log spread for verification (in bps)
-            actual_spread_bps = (Decimal(str(ask_price)) - Decimal(str(bid_price))) / mark_price * Decimal('10000')
-            logger.debug(f"Spread: {actual_spread_bps:.1f} bps (bid=${bid_price:,.2f}, ask=${ask_price:,.2f}, mark=${mark_price:,.2f})")
+            if logger.isEnabledFor(logging.DEBUG):
+                actual_spread_bps = (ask_ticks - bid_ticks) * 10000 / mark_ticks
+                logger.debug("Spread: %.1f bps (bid=$%s, ask=$%s, mark=$%s)", actual_spread_bps,
+                             _Usd(bid_price), _Usd(ask_price), _Usd(self.current_price))
 
             # Check if we can place orders
             if not self.risk_mgr.can_place_order(len(self.standx.active_orders)):
                 logger.warning("Max orders limit reached")
                 return
 
-            # Place bid order
-            bid_order = await self.standx.place_order("buy", bid_price, float(self.order_size))
-            bid_cl_ord_id = None
-            if bid_order:
-                bid_cl_ord_id = bid_order.cl_ord_id
-                self.state_machine.track_order(
-                    cl_ord_id=bid_cl_ord_id,
-                    side="buy",
-                    price=Decimal(str(bid_price)),
-                    quantity=self.order_size
-                )
-                symbol = self.standx.symbol.split('-')[0]  # e.g., "BTC"
-                logger.info(f"✓ Bid placed: {symbol} @ ${bid_price:,.2f}")
-
-            # Place ask order
-            ask_order = await self.standx.place_order("sell", ask_price, float(self.order_size))
-            ask_cl_ord_id = None
-            if ask_order:
-                ask_cl_ord_id = ask_order.cl_ord_id
+            # Place bid and ask as one buffered batch
+            qty = float(self.order_size)
+            async with self.standx.buffered_quotes() as quotes:
+                quotes.queue_place("buy", bid_price, qty)
+                quotes.queue_place("sell", ask_price, qty)
+            results = quotes.results
+
+            symbol = self.standx.symbol.split('-')[0]  # e.g., "BTC"
+            pending_orders = set()
+            for side, price, order in zip(("buy", "sell"), (bid_price, ask_price), results):
+                label = "Bid" if side == "buy" else "Ask"
+                if isinstance(order, Exception):
+                    logger.error("%s placement raised: %s", label, order)
+                    continue
+                if not order:
+                    continue
                 self.state_machine.track_order(
-                    cl_ord_id=ask_cl_ord_id,
-                    side="sell",
-                    price=Decimal(str(ask_price)),
+                    cl_ord_id=order.cl_ord_id,
+                    side=side,
+                    price=_to_dec(price),
                     quantity=self.order_size
                 )
-                symbol = self.standx.symbol.split('-')[0]  # e.g., "BTC"
-                logger.info(f"✓ Ask placed: {symbol} @ ${ask_price:,.2f}")
+                pending_orders.add(order.cl_ord_id)
+                logger.info("✓ %s placed: %s @ $%s", label, symbol, _Usd(price))
 
             # Transition to PLACING state
-            pending_orders = [o for o in [bid_cl_ord_id, ask_cl_ord_id] if o]
             if pending_orders:
                 self.state_machine.on_placing_orders(pending_orders)
 
+        except OSError as e:
+            logger.warning("Transient error placing orders: %s", e)
         except Exception as e:
-            logger.error(f"Error placing orders: {e}", exc_info=True)
+            self._log_error_sampled("Error placing orders", e)
+
+    async def _wait_cancels_confirmed(self, timeout: float = 1.0):
+        """
+        Wait for WebSocket cancel confirmations to move the state machine out of
+        CANCELLING, returning as soon as they arrive (at most timeout seconds).
+        """
+        deadline = time.monotonic() + timeout
+        while self.state_machine.state == BotState.CANCELLING:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._cancel_event.clear()
+            try:
+                await asyncio.wait_for(self._cancel_event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
 
     async def check_and_update_orders(self):
         """Check if orders need to be cancelled and replaced"""
         try:
             # Check state machine - only check in MARKET_MAKING state
             if not self.state_machine.can_check_orders():
-                logger.debug(f"Skip order check in state {self.state_machine.state_name}")
+                logger.debug("Skip order check in state %s", self.state_machine.state_name)
                 return
 
             # Get current price
-            ticker = self.standx.get_ticker()
-            mark_price = Decimal(str(ticker.get("mark_price", 0)))
+            ticker = await self._get_ticker_cached()
+            mark_ticks = _to_ticks(ticker.get("mark_price", 0), PRICE_TICK_SCALE)
 
-            if mark_price <= 0:
+            if mark_ticks <= 0:
                 return
 
-            self.current_price = mark_price
+            self.current_price = mark_ticks / PRICE_TICK_SCALE
 
             # Sync open orders
             await self.standx.sync_open_orders()
 
             # Check if any market making order is too close to current price
             # Exclude close orders from this check
-            needs_update = False
             close_order = self.state_machine.get_close_order()
             close_order_id = close_order.order_id if close_order else None
 
-            for order_id, order_info in self.standx.active_orders.items():
-                # Skip close order
-                if str(order_id) == str(close_order_id):
-                    continue
-
-                price_diff_pct = abs(Decimal(str(order_info.price)) - mark_price) / mark_price
+            # Compare |price - mark| against threshold * mark, all in integer ticks
+            # Ceiling, so |diff| < threshold_ticks matches |diff| < threshold * mark for integer diffs
+            threshold_ticks = -(-mark_ticks * self._threshold_num // self._threshold_den)
 
-                if price_diff_pct < Decimal(str(self.cancel_threshold)):
-                    side = "Bid" if order_info.side == "buy" else "Ask"
-                    logger.info(f"{side} ${order_info.price:,.2f} too close to ${mark_price:,.2f}")
-                    needs_update = True
-                    break
+            # Only the order nearest to mark can be the offender (bisect on price index)
+            nearest = self.standx.nearest_order(mark_ticks, exclude_order_id=close_order_id)
+            too_close = nearest if nearest is not None and abs(nearest.price_ticks - mark_ticks) < threshold_ticks else None
+            needs_update = too_close is not None
+            if needs_update:
+                side = "Bid" if too_close.side == "buy" else "Ask"
+                logger.info("%s $%s too close to $%s", side, _Usd(too_close.price), _Usd(self.current_price))
 
             # If orders need updating, cancel market making orders only (not close orders)
             # Count market making orders (exclude close order)
@@ -337,19 +581,25 @@ class StandXMakerHedger:
                     # Cancel only market making orders
                     self.state_machine.on_cancelling_orders(orders_to_cancel)
                     await self.standx.cancel_orders(exclude_close_order=True)
-                    await asyncio.sleep(1)  # Brief pause
+                    await self._wait_cancels_confirmed()
 
-                # Place new orders
-                await self.place_market_making_orders()
+                # Place new orders at the price already read this cycle
+                await self.place_market_making_orders(mark_ticks)
 
+        except OSError as e:
+            logger.warning("Transient error checking orders: %s", e)
         except Exception as e:
-            logger.error(f"Error checking orders: {e}", exc_info=True)
+            self._log_error_sampled("Error checking orders", e)
 
     async def check_and_manage_close_orders(self):
         """
         Check if we have open positions that need closing.
         Manage close orders by adjusting them if price moves significantly.
         """
+        if self._hedge_pending():
+            logger.debug("Skip close order management, hedge pending")
+            return
+
         try:
             # Get current positions
             standx_pos = await self.standx.get_position()
@@ -366,7 +616,7 @@ class StandXMakerHedger:
 
             # If we have positions but no close order, something went wrong
             if (standx_pos != 0 or lighter_pos != 0) and not self.close_order_cl_ord_id:
-                logger.warning(f"Have positions (SX={standx_pos}, LT={lighter_pos}) but no close order tracked")
+                logger.warning("Have positions (SX=%s, LT=%s) but no close order tracked", standx_pos, lighter_pos)
 
                 # Handle StandX position
                 if standx_pos > 0:
@@ -386,7 +636,7 @@ class StandXMakerHedger:
                     attempts = self.lighter_close_attempts.get(pos_key, 0)
 
                     if attempts >= self.max_close_attempts:
-                        logger.error(f"CRITICAL: Failed to close Lighter position {lighter_pos} BTC after {attempts} attempts")
+                        logger.error("CRITICAL: Failed to close Lighter position %s BTC after %s attempts", lighter_pos, attempts)
                         logger.error("MANUAL INTERVENTION REQUIRED - Stopping auto-close attempts for this position")
                         logger.error("Please manually close the Lighter position and restart the bot")
                         # Block further attempts for this position
@@ -394,7 +644,7 @@ class StandXMakerHedger:
                         return
 
                     self.lighter_close_attempts[pos_key] = attempts + 1
-                    logger.warning(f"StandX position is 0 but Lighter has {lighter_pos} BTC (attempt {attempts + 1}/{self.max_close_attempts})")
+                    logger.warning("StandX position is 0 but Lighter has %s BTC (attempt %s/%s)", lighter_pos, attempts + 1, self.max_close_attempts)
                     await self.close_lighter_hedge(lighter_pos)
 
                     # If close was successful, reset the counter
@@ -414,8 +664,8 @@ class StandXMakerHedger:
             # If we have a close order, check if it needs adjustment
             if self.close_order_cl_ord_id and self.close_order_price and self.close_order_side:
                 # Get current price
-                ticker = self.standx.get_ticker()
-                mark_price = Decimal(str(ticker.get("mark_price", 0)))
+                ticker = await self._get_ticker_cached()
+                mark_price = _to_dec(ticker.get("mark_price", 0))
 
                 if mark_price <= 0:
                     return
@@ -426,20 +676,20 @@ class StandXMakerHedger:
                 # Find order by cl_ord_id
                 close_order_exists = False
                 close_order_real_id = None
-                for order_id, order_info in self.standx.active_orders.items():
-                    if order_info.cl_ord_id == self.close_order_cl_ord_id:
-                        close_order_exists = True
-                        close_order_real_id = order_id
-                        # Update real order_id if we haven't saved it yet
-                        if not self.close_order_id:
-                            self.close_order_id = order_id
-                            # Mark this order as a close order
-                            self.standx.mark_as_close_order(order_id)
-                        break
+                order_info = self.standx.get_order_by_cl_ord_id(self.close_order_cl_ord_id)
+                if order_info is not None:
+                    order_id = order_info.order_id
+                    close_order_exists = True
+                    close_order_real_id = order_id
+                    # Update real order_id if we haven't saved it yet
+                    if not self.close_order_id:
+                        self.close_order_id = order_id
+                        # Mark this order as a close order
+                        self.standx.mark_as_close_order(order_id)
 
                 if not close_order_exists:
                     # Close order was filled or cancelled
-                    logger.info(f"Close order (cl_ord_id={self.close_order_cl_ord_id}) no longer active")
+                    logger.info("Close order (cl_ord_id=%s) no longer active", self.close_order_cl_ord_id)
 
                     # Check if position is closed
                     standx_pos_after = await self.standx.get_position()
@@ -474,18 +724,18 @@ class StandXMakerHedger:
 
                 if self.close_order_side == "sell" and price_diff > 0:
                     # Price rose, sell order should be adjusted higher
-                    if price_diff_pct > Decimal(str(self.close_update_threshold)):
-                        logger.info(f"Price rose from ${self.close_order_price:,.2f} to ${mark_price:,.2f}, adjusting sell close order")
+                    if price_diff_pct > self._close_update_threshold_dec:
+                        logger.info("Price rose from $%s to $%s, adjusting sell close order", _Usd(self.close_order_price), _Usd(mark_price))
                         needs_adjustment = True
                 elif self.close_order_side == "buy" and price_diff < 0:
                     # Price fell, buy order should be adjusted lower
-                    if price_diff_pct > Decimal(str(self.close_update_threshold)):
-                        logger.info(f"Price fell from ${self.close_order_price:,.2f} to ${mark_price:,.2f}, adjusting buy close order")
+                    if price_diff_pct > self._close_update_threshold_dec:
+                        logger.info("Price fell from $%s to $%s, adjusting buy close order", _Usd(self.close_order_price), _Usd(mark_price))
                         needs_adjustment = True
 
                 if needs_adjustment:
                     # Cancel current close order and place new one
-                    logger.info(f"Cancelling close order {self.close_order_id} for adjustment")
+                    logger.info("Cancelling close order %s for adjustment", self.close_order_id)
                     await self.standx.cancel_order(self.close_order_id)
                     await asyncio.sleep(0.5)  # Brief pause
 
@@ -496,7 +746,7 @@ class StandXMakerHedger:
                         await self.place_close_order(side="buy", quantity=abs(standx_pos))
 
         except Exception as e:
-            logger.error(f"Error managing close orders: {e}", exc_info=True)
+            logger.error("Error managing close orders: %s", e, exc_info=True)
 
     async def sync_hedge_positions(self, max_retries: int = 3) -> bool:
         """
@@ -509,11 +759,20 @@ class StandXMakerHedger:
         Returns:
             True if positions are balanced, False otherwise
         """
+        if self._hedge_pending():
+            logger.debug("Skip hedge sync, hedge pending")
+            return True
+
         try:
             # Get current positions
             standx_pos = await self.standx.get_position()
             lighter_pos = await self.lighter.get_position() if self.lighter.enabled else Decimal('0')
 
+            # A fill may have arrived while the positions were being read
+            if self._hedge_pending():
+                logger.debug("Skip hedge sync, hedge pending")
+                return True
+
             # Calculate target Lighter position (should be opposite of StandX)
             target_lighter_pos = -standx_pos
 
@@ -522,29 +781,29 @@ class StandXMakerHedger:
 
             # Check if adjustment is needed (with small tolerance)
             if abs(adjustment) < Decimal('0.0001'):
-                logger.debug(f"Positions balanced: SX={standx_pos}, LT={lighter_pos}")
+                logger.debug("Positions balanced: SX=%s, LT=%s", standx_pos, lighter_pos)
                 return True
 
             # Log imbalance
             total = standx_pos + lighter_pos
-            logger.warning(f"Hedge imbalance detected:")
-            logger.warning(f"  StandX: {standx_pos} BTC")
-            logger.warning(f"  Lighter: {lighter_pos} BTC")
-            logger.warning(f"  Total: {total} BTC (should be 0)")
-            logger.warning(f"  Adjustment needed: {adjustment} BTC")
+            logger.warning("Hedge imbalance detected:")
+            logger.warning("  StandX: %s BTC", standx_pos)
+            logger.warning("  Lighter: %s BTC", lighter_pos)
+            logger.warning("  Total: %s BTC (should be 0)", total)
+            logger.warning("  Adjustment needed: %s BTC", adjustment)
 
             # Retry loop for adjustment
             for attempt in range(1, max_retries + 1):
                 if adjustment > 0:
                     # Need to increase Lighter long (or decrease short)
-                    logger.info(f"→ Adjusting Lighter: BUY {abs(adjustment)} BTC (attempt {attempt}/{max_retries})")
+                    logger.info("→ Adjusting Lighter: BUY %s BTC (attempt %s/%s)", abs(adjustment), attempt, max_retries)
                     success = await self.lighter.place_hedge_order(
                         side="buy",
                         quantity=abs(adjustment)
                     )
                 else:
                     # Need to increase Lighter short (or decrease long)
-                    logger.info(f"→ Adjusting Lighter: SELL {abs(adjustment)} BTC (attempt {attempt}/{max_retries})")
+                    logger.info("→ Adjusting Lighter: SELL %s BTC (attempt %s/%s)", abs(adjustment), attempt, max_retries)
                     success = await self.lighter.place_hedge_order(
                         side="sell",
                         quantity=abs(adjustment)
@@ -559,21 +818,21 @@ class StandXMakerHedger:
                     total_after = standx_pos_after + lighter_pos_after
 
                     if abs(total_after) < Decimal('0.0001'):
-                        logger.info(f"✓ Positions balanced: SX={standx_pos_after}, LT={lighter_pos_after}")
+                        logger.info("✓ Positions balanced: SX=%s, LT=%s", standx_pos_after, lighter_pos_after)
                         return True
                     else:
-                        logger.warning(f"Positions still imbalanced: total={total_after} (attempt {attempt}/{max_retries})")
+                        logger.warning("Positions still imbalanced: total=%s (attempt %s/%s)", total_after, attempt, max_retries)
                         if attempt < max_retries:
                             # Recalculate adjustment for next attempt
                             target_lighter_pos = -standx_pos_after
                             adjustment = target_lighter_pos - lighter_pos_after
                             await asyncio.sleep(attempt)  # Backoff
                         else:
-                            logger.error(f"Failed to balance positions after {max_retries} attempts")
-                            logger.error(f"Final state: SX={standx_pos_after}, LT={lighter_pos_after}, Total={total_after}")
+                            logger.error("Failed to balance positions after %s attempts", max_retries)
+                            logger.error("Final state: SX=%s, LT=%s, Total=%s", standx_pos_after, lighter_pos_after, total_after)
                             return False
                 else:
-                    logger.error(f"Failed to adjust Lighter position (attempt {attempt}/{max_retries})")
+                    logger.error("Failed to adjust Lighter position (attempt %s/%s)", attempt, max_retries)
                     if attempt < max_retries:
                         await asyncio.sleep(attempt)
                     else:
@@ -582,7 +841,7 @@ class StandXMakerHedger:
             return False
 
         except Exception as e:
-            logger.error(f"Error syncing hedge positions: {e}", exc_info=True)
+            logger.error("Error syncing hedge positions: %s", e, exc_info=True)
             return False
 
     async def close_lighter_hedge(self, lighter_pos: Decimal, max_retries: int = 3):
@@ -595,7 +854,7 @@ class StandXMakerHedger:
             max_retries: Maximum number of retry attempts (default: 3)
         """
         try:
-            logger.info(f"→ Adjusting Lighter hedge (current: {lighter_pos} BTC)")
+            logger.info("→ Adjusting Lighter hedge (current: %s BTC)", lighter_pos)
 
             # Use sync_hedge_positions to balance positions
             # This handles partial fills correctly
@@ -608,8 +867,8 @@ class StandXMakerHedger:
                 logger.error("CRITICAL: Manual intervention may be required!")
 
         except Exception as e:
-            logger.error(f"Error adjusting Lighter hedge: {e}", exc_info=True)
-            logger.error(f"CRITICAL: Manual intervention required!")
+            logger.error("Error adjusting Lighter hedge: %s", e, exc_info=True)
+            logger.error("CRITICAL: Manual intervention required!")
 
 
     async def run(self):
@@ -626,7 +885,8 @@ class StandXMakerHedger:
             logger.error("Failed to connect to StandX, exiting")
             return
 
-        # Setup order fill handler
+        # Setup order fill handler; fills are hedged by a dedicated consumer task
+        self._hedge_task = asyncio.create_task(self._hedge_consumer())
         self.standx.setup_order_update_handler(self.handle_standx_order_fill)
 
         # Setup state machine callbacks
@@ -643,7 +903,7 @@ class StandXMakerHedger:
 
         # Check risk status
         risk_status = self.risk_mgr.get_status()
-        logger.info(f"Risk Status: {risk_status}")
+        logger.info("Risk Status: %s", risk_status)
 
         if risk_status["emergency_stop"]:
             logger.error("Emergency stop is active, cannot start bot")
@@ -654,6 +914,7 @@ class StandXMakerHedger:
 
         # Start main loop
         self.running = True
+        loop = asyncio.get_running_loop()
 
         try:
             # Wait for WebSocket to be ready before placing orders，用循环10秒来等待WebSocket连接就绪
@@ -663,7 +924,7 @@ class StandXMakerHedger:
                 if self.standx.ws_manager and self.standx.ws_manager.is_ready:
                     logger.info("WebSocket ready, placing initial orders...")
                     break
-                logger.debug(f"Waiting for WebSocket connection... ({i+1}/{max_wait})")
+                logger.debug("Waiting for WebSocket connection... (%s/%s)", i+1, max_wait)
                 await asyncio.sleep(1)
             else:
                 logger.warning("WebSocket not ready after timeout, placing orders anyway")
@@ -672,6 +933,9 @@ class StandXMakerHedger:
             await self.place_market_making_orders()
 
             while self.running:
+                # One clock read per tick, shared by the time-based checks below
+                now = loop.time()
+
                 # Check emergency stop
                 if self.risk_mgr.emergency_stop:
                     logger.error("EMERGENCY STOP TRIGGERED - Shutting down")
@@ -689,47 +953,53 @@ class StandXMakerHedger:
                     await self.sync_hedge_positions()
 
                 # Print status only if needed (changes or hourly)
-                await self.print_status_if_needed()
+                await self.print_status_if_needed(now)
 
-                # Sleep before next iteration
-                await asyncio.sleep(self.check_interval)
+                # Wait for the next WebSocket order event, or check_interval at most
+                try:
+                    await asyncio.wait_for(self._wake_event.wait(), timeout=self.check_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake_event.clear()
 
         except KeyboardInterrupt:
             logger.info("\nReceived shutdown signal...")
         except Exception as e:
-            logger.error(f"Fatal error in main loop: {e}", exc_info=True)
+            logger.error("Fatal error in main loop: %s", e, exc_info=True)
         finally:
             await self.shutdown()
 
-    async def print_status_if_needed(self):
+    async def print_status_if_needed(self, now: float = None):
         """
         Print bot status only if:
         1. Something changed (position, orders, trades, P&L)
         2. Or 1 hour has passed since last status print
+
+        Args:
+            now: Event-loop time of the current tick (read from the loop if None)
         """
         try:
-            import time
-            current_time = time.time()
+            if now is None:
+                now = asyncio.get_running_loop().time()
 
-            # Get current status
-            risk_status = self.risk_mgr.get_status()
-            standx_pos = await self.standx.get_position()
-            lighter_pos = await self.lighter.get_position()
+            # Get current status (read counters directly, no status dict needed)
+            standx_pos, lighter_pos = await self._get_status_positions()
             order_count = len(self.standx.active_orders)
-            trade_count = risk_status['trade_count']
-            total_pnl = risk_status['total_pnl']
+            trade_count = self.risk_mgr.trade_count
+            total_pnl = self.risk_mgr.total_pnl
 
             # Check if anything changed
+            last = self.last_status
             has_changes = (
-                standx_pos != self.last_status['standx_pos'] or
-                lighter_pos != self.last_status['lighter_pos'] or
-                order_count != self.last_status['order_count'] or
-                trade_count != self.last_status['trade_count'] or
-                abs(total_pnl - self.last_status['pnl']) > 0.01
+                standx_pos != last.standx_pos or
+                lighter_pos != last.lighter_pos or
+                order_count != last.order_count or
+                trade_count != last.trade_count or
+                abs(total_pnl - last.pnl) > 0.01
             )
 
             # Check if 1 hour has passed
-            hour_passed = (current_time - self.last_hourly_status_time) >= 3600
+            hour_passed = now >= self.next_hourly_status_time
 
             # Print if changes or hourly
             if has_changes or hour_passed:
@@ -738,62 +1008,63 @@ class StandXMakerHedger:
                 symbol = self.standx.symbol  # e.g., "BTC-USD"
                 base_symbol = symbol.split('-')[0]  # e.g., "BTC"
                 logger.info(
-                    f"Status: ${self.current_price:,.2f} | "
-                    f"Orders={order_count} | "
-                    f"Pos: SX={standx_pos:.2f}{base_symbol} LT={lighter_pos:.2f}{base_symbol} | "
-                    f"P&L=${total_pnl:.2f} | "
-                    f"Trades={trade_count}"
+                    "Status: $%s | Orders=%s | Pos: SX=%.2f%s LT=%.2f%s | P&L=$%.2f | Trades=%s",
+                    _Usd(self.current_price), order_count,
+                    standx_pos, base_symbol, lighter_pos, base_symbol,
+                    total_pnl, trade_count
                 )
 
-                # Update last status
-                self.last_status = {
-                    'standx_pos': standx_pos,
-                    'lighter_pos': lighter_pos,
-                    'order_count': order_count,
-                    'trade_count': trade_count,
-                    'pnl': total_pnl
-                }
+                # Update last status in place
+                last.standx_pos = standx_pos
+                last.lighter_pos = lighter_pos
+                last.order_count = order_count
+                last.trade_count = trade_count
+                last.pnl = total_pnl
 
                 # Update hourly timer if it was hourly print
                 if hour_passed:
-                    self.last_hourly_status_time = current_time
+                    self.next_hourly_status_time = now + 3600
 
         except Exception as e:
-            logger.error(f"Error checking status: {e}")
+            logger.error("Error checking status: %s", e)
 
     async def print_status(self):
         """Print detailed bot status (called on demand or startup)"""
         try:
             risk_status = self.risk_mgr.get_status()
-            standx_pos = await self.standx.get_position()
-            lighter_pos = await self.lighter.get_position()
+            standx_pos, lighter_pos = await self._get_status_positions()
 
             logger.info("=" * 60)
-            logger.info(f"Bot Status at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            logger.info(f"  Current Price: {self.current_price}")
-            logger.info(f"  Open Orders (StandX): {len(self.standx.active_orders)}")
-            logger.info(f"  StandX Position: {standx_pos}")
-            logger.info(f"  Lighter Position: {lighter_pos}")
-            logger.info(f"  Daily P&L: ${risk_status['daily_pnl']:.2f}")
-            logger.info(f"  Total P&L: ${risk_status['total_pnl']:.2f}")
-            logger.info(f"  Trade Count: {risk_status['trade_count']}")
-            logger.info(f"  Emergency Stop: {risk_status['emergency_stop']}")
+            logger.info("Bot Status")
+            logger.info("  Current Price: %s", self.current_price)
+            logger.info("  Open Orders (StandX): %s", len(self.standx.active_orders))
+            logger.info("  StandX Position: %s", standx_pos)
+            logger.info("  Lighter Position: %s", lighter_pos)
+            logger.info("  Daily P&L: $%.2f", risk_status['daily_pnl'])
+            logger.info("  Total P&L: $%.2f", risk_status['total_pnl'])
+            logger.info("  Trade Count: %s", risk_status['trade_count'])
+            logger.info("  Emergency Stop: %s", risk_status['emergency_stop'])
             logger.info("=" * 60)
 
         except Exception as e:
-            logger.error(f"Error printing status: {e}")
+            logger.error("Error printing status: %s", e)
 
     async def shutdown(self):
         """Graceful shutdown"""
         logger.info("Shutting down bot...")
         self.running = False
 
+        # Stop the hedge consumer
+        if self._hedge_task:
+            self._hedge_task.cancel()
+            await asyncio.gather(self._hedge_task, return_exceptions=True)
+
         # Cancel all open orders on StandX
         logger.info("Cancelling all open orders on StandX...")
         try:
             await self.standx.cancel_orders()
         except Exception as e:
-            logger.error(f"Error cancelling orders: {e}")
+            logger.error("Error cancelling orders: %s", e)
 
         # Optionally close Lighter position
         if self.config.get("strategy.close_position_on_shutdown", False):
@@ -801,30 +1072,37 @@ class StandXMakerHedger:
             try:
                 await self.lighter.close_position()
             except Exception as e:
-                logger.error(f"Error closing position: {e}")
-
-        # Disconnect from exchanges
-        try:
-            await self.standx.disconnect()
-        except Exception as e:
-            logger.error(f"Error disconnecting from StandX: {e}")
-
-        try:
-            await self.lighter.disconnect()
-        except Exception as e:
-            logger.error(f"Error disconnecting from Lighter: {e}")
+                logger.error("Error closing position: %s", e)
+
+        # Disconnect from exchanges concurrently
+        results = await asyncio.gather(
+            self.standx.disconnect(),
+            self.lighter.disconnect(),
+            return_exceptions=True
+        )
+        for name, result in zip(("StandX", "Lighter"), results):
+            if isinstance(result, Exception):
+                logger.error("Error disconnecting from %s: %s", name, result)
 
         logger.info("Shutdown complete")
 
 
-def setup_logging(config):
-    """Setup logging configuration"""
+def setup_logging(config) -> logging.handlers.QueueListener:
+    """
+    Setup logging configuration.
+
+    Records are handed to a QueueHandler on the calling thread; a background
+    QueueListener owns the file and console handlers so disk/terminal writes
+    never block the event loop. The caller must stop() the returned listener
+    to flush pending records on exit.
+    """
     log_level = config.get("logging.log_level", "INFO")
     log_file = config.get("logging.log_file", "logs/arbitrage_bot.log")
 
-    # Create logs directory if it doesn't exist
-    import os
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    # Create logs directory if it doesn't exist (bare filenames need no directory)
+    log_dir = Path(log_file).parent
+    if not log_dir.is_dir():
+        log_dir.mkdir(parents=True, exist_ok=True)
 
     # Custom formatter with milliseconds
     class MillisecondFormatter(logging.Formatter):
@@ -857,22 +1135,24 @@ def setup_logging(config):
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
 
+    # Background listener performs the actual writes
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
     root_logger.handlers.clear()
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    return listener
 
 
 async def main_async():
     """Async main entry point"""
-    # Load config
-    config = get_config()
-
-    # Setup logging
-    setup_logging(config)
-
     logger.info("Starting StandX Maker Hedger System")
 
     # Create and run bot
@@ -882,12 +1162,21 @@ async def main_async():
 
 def main():
     """Main entry point"""
+    # Load config and setup logging before the event loop starts
+    listener = setup_logging(get_config())
+
+    # Optional faster event loop (uvloop when installed)
+    if event_loop.USING_UVLOOP:
+        logger.info("Using uvloop event loop")
+
     try:
-        asyncio.run(main_async())
+        event_loop.run(main_async())
     except KeyboardInterrupt:
         logger.info("Received interrupt signal")
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
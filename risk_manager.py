@@ -30,27 +30,47 @@ class RiskManager:
         self.emergency_stop_loss = config.get("risk_management.emergency_stop_loss", 1000.0)
         self.max_open_orders = config.get("risk_management.max_open_orders", 10)
 
+        # Loss limits as P&L floors (negated once, compared directly)
+        self._daily_loss_floor = -self.max_daily_loss
+        self._total_loss_floor = -self.emergency_stop_loss
+
         # Tracking
         self.daily_pnl = 0.0
         self.total_pnl = 0.0
         self.trade_count = 0
         self.last_reset_date = datetime.now().date()
+        # Epoch timestamp of the next local midnight; before it no reset is possible
+        self._next_day_start = self._day_start_after(self.last_reset_date)
 
         # Emergency stop flag
         self.emergency_stop = False
 
-        logger.info(f"Risk Manager initialized:")
-        logger.info(f"  Max Position Size: {self.max_position_size}")
-        logger.info(f"  Max Daily Loss: {self.max_daily_loss}")
-        logger.info(f"  Emergency Stop Loss: {self.emergency_stop_loss}")
+        # Cached get_status() result, cleared by any state mutation
+        self._status_cache: Optional[Dict] = None
+
+        logger.info("Risk Manager initialized:")
+        logger.info("  Max Position Size: %s", self.max_position_size)
+        logger.info("  Max Daily Loss: %s", self.max_daily_loss)
+        logger.info("  Emergency Stop Loss: %s", self.emergency_stop_loss)
+
+    @staticmethod
+    def _day_start_after(date) -> float:
+        """Epoch timestamp of local midnight following the given date"""
+        return datetime.combine(date + timedelta(days=1), datetime.min.time()).timestamp()
 
     def reset_daily_counters(self):
         """Reset daily P&L if new day"""
+        # Single float compare on the hot path; only build a date at day boundaries
+        if time.time() < self._next_day_start:
+            return
+
         current_date = datetime.now().date()
+        self._next_day_start = self._day_start_after(current_date)
         if current_date > self.last_reset_date:
-            logger.info(f"New day, resetting daily P&L. Previous: {self.daily_pnl}")
+            logger.info("New day, resetting daily P&L. Previous: %s", self.daily_pnl)
             self.daily_pnl = 0.0
             self.last_reset_date = current_date
+            self._status_cache = None
 
     def update_pnl(self, pnl: float):
         """
@@ -63,23 +83,30 @@ class RiskManager:
         self.daily_pnl += pnl
         self.total_pnl += pnl
         self.trade_count += 1
+        self._status_cache = None
 
-        logger.info(f"P&L Update: Trade={pnl:.2f}, Daily={self.daily_pnl:.2f}, Total={self.total_pnl:.2f}")
+        logger.info("P&L Update: Trade=%.2f, Daily=%.2f, Total=%.2f", pnl, self.daily_pnl, self.total_pnl)
 
         # Check emergency stop
         self.check_emergency_stop()
 
     def check_emergency_stop(self):
         """Check if emergency stop should be triggered"""
+        # Common case: both P&L figures above their floors
+        if self.daily_pnl > self._daily_loss_floor and self.total_pnl > self._total_loss_floor:
+            return
+
         # Check daily loss limit
-        if self.daily_pnl <= -self.max_daily_loss:
-            logger.error(f"EMERGENCY STOP: Daily loss limit reached! Loss: {self.daily_pnl}")
+        if self.daily_pnl <= self._daily_loss_floor:
+            logger.error("EMERGENCY STOP: Daily loss limit reached! Loss: %s", self.daily_pnl)
             self.emergency_stop = True
+            self._status_cache = None
 
         # Check total loss limit
-        if self.total_pnl <= -self.emergency_stop_loss:
-            logger.error(f"EMERGENCY STOP: Total loss limit reached! Loss: {self.total_pnl}")
+        if self.total_pnl <= self._total_loss_floor:
+            logger.error("EMERGENCY STOP: Total loss limit reached! Loss: %s", self.total_pnl)
             self.emergency_stop = True
+            self._status_cache = None
 
     def can_open_position(self, position_size: float) -> bool:
         """
@@ -96,13 +123,13 @@ class RiskManager:
             return False
 
         if abs(position_size) > self.max_position_size:
-            logger.warning(f"Position size {position_size} exceeds limit {self.max_position_size}")
+            logger.warning("Position size %s exceeds limit %s", position_size, self.max_position_size)
             return False
 
         self.reset_daily_counters()
 
-        if self.daily_pnl <= -self.max_daily_loss:
-            logger.warning(f"Daily loss limit reached: {self.daily_pnl}")
+        if self.daily_pnl <= self._daily_loss_floor:
+            logger.warning("Daily loss limit reached: %s", self.daily_pnl)
             return False
 
         return True
@@ -122,7 +149,7 @@ class RiskManager:
             return False
 
         if current_open_orders >= self.max_open_orders:
-            logger.warning(f"Max open orders limit reached: {current_open_orders}")
+            logger.warning("Max open orders limit reached: %s", current_open_orders)
             return False
 
         return True
@@ -141,7 +168,7 @@ class RiskManager:
         """
         pnl = (exit_price - entry_price) * quantity
         if abs(pnl) < self.min_profit_threshold:
-            logger.info(f"Trade profit {pnl:.2f} below threshold {self.min_profit_threshold}")
+            logger.info("Trade profit %.2f below threshold %s", pnl, self.min_profit_threshold)
             return False
 
         return True
@@ -150,12 +177,18 @@ class RiskManager:
         """
         Get risk manager status.
 
+        The values are cached and only rebuilt after a state change; each call
+        returns a fresh copy, so callers may modify it.
+
         Returns:
             Dictionary with status information
         """
         self.reset_daily_counters()
 
-        return {
+        if self._status_cache is not None:
+            return dict(self._status_cache)
+
+        self._status_cache = {
             "emergency_stop": self.emergency_stop,
             "daily_pnl": self.daily_pnl,
             "total_pnl": self.total_pnl,
@@ -164,13 +197,16 @@ class RiskManager:
             "max_position_size": self.max_position_size,
             "daily_loss_remaining": self.max_daily_loss + self.daily_pnl
         }
+        return dict(self._status_cache)
 
     def force_stop(self):
         """Force emergency stop"""
         logger.error("FORCED EMERGENCY STOP")
         self.emergency_stop = True
+        self._status_cache = None
 
     def reset_emergency_stop(self):
         """Reset emergency stop (use with caution)"""
         logger.warning("Resetting emergency stop flag")
         self.emergency_stop = False
+        self._status_cache = None
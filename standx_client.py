@@ -4,14 +4,25 @@ Independent implementation using StandX SDK
 """
 import os
 import json
+import random
+import socket
 import base64
+import bisect
+import contextlib
+import functools
+import inspect
+import itertools
+import sys
 import time
 import asyncio
 import logging
 import websockets
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
 import base58
 from decimal import Decimal
+from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple, Callable
 from solders.keypair import Keypair
 
@@ -23,6 +34,121 @@ from config_loader import get_config
 
 logger = logging.getLogger(__name__)
 
+# Optional fast JSON codec for the WebSocket and login paths (both loads accept str or bytes)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps_bytes = orjson.dumps  # Compact, UTF-8 bytes
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+# Prices are also carried as integer ticks of 1/PRICE_TICK_SCALE for fast comparisons
+PRICE_TICK_SCALE = 100
+
+# Headers for pre-encoded JSON request bodies
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Streams subscribed together with WebSocket auth
+_WS_STREAMS = [
+    {"channel": "order"}  # Subscribe to order updates
+]
+
+# Login token lifetime requested from StandX, and the on-disk cache that lets
+# restarts skip the sign-in round trip while the token is still valid
+TOKEN_EXPIRES_SECONDS = 604800
+TOKEN_CACHE_PATH = Path.home() / ".standx_cache" / "token.json"
+# Cached tokens with less than this many seconds left are not reused
+TOKEN_MIN_REMAINING = 600
+
+# Solana sign-in payload: SIWS input fields (in order) and the fixed JSON skeleton
+# that the pre-encoded parts are substituted into
+_SIG_INPUT_FIELDS = ("domain", "address", "statement", "uri", "version",
+                     "chainId", "nonce", "issuedAt", "requestId")
+_SIG_TEMPLATE = ('{{"input":{input},"output":{{"account":{{"publicKey":{public_key}}},'
+                 '"signature":{signature},"signedMessage":{message}}}}}')
+
+
+def _json_byte_array(data: bytes) -> str:
+    """Encode bytes as a compact JSON array of ints, e.g. bytes([1, 2]) -> [1,2]"""
+    return "[" + ",".join(map(str, data)) + "]"
+
+
+def load_cached_token(wallet_address: str, auth_url: str) -> Optional[str]:
+    """
+    Read the login token cache.
+
+    Args:
+        wallet_address: Wallet the token must belong to
+        auth_url: Auth host the token must come from
+
+    Returns:
+        The cached token if it matches and has more than TOKEN_MIN_REMAINING left, else None
+    """
+    try:
+        cached = _json_loads(TOKEN_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if cached.get("address") != wallet_address or cached.get("auth_url") != auth_url:
+        return None
+    if cached.get("expires_at", 0) - time.time() <= TOKEN_MIN_REMAINING:
+        return None
+    return cached.get("token")
+
+
+def save_cached_token(token: str, wallet_address: str, auth_url: str, issued_at: float):
+    """Persist a login token requested at issued_at (owner-only permissions)"""
+    try:
+        TOKEN_CACHE_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        data = _json_dumps({
+            "token": token,
+            "address": wallet_address,
+            "auth_url": auth_url,
+            "expires_at": issued_at + TOKEN_EXPIRES_SECONDS
+        })
+        fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+    except OSError as e:
+        logger.warning("Could not write token cache: %s", e)
+
+
+def clear_cached_token():
+    """Drop the token cache (e.g. after the server rejected the token)"""
+    try:
+        TOKEN_CACHE_PATH.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("Could not remove token cache: %s", e)
+
+
+# OrderInfo.flags bits
+FLAG_CLOSE = 1  # Position-closing order: its fills must NOT trigger a hedge
+
+
+@functools.lru_cache(maxsize=4)
+def _load_keypair(private_key_str: str) -> Tuple[Keypair, bytes]:
+    """
+    Decode a base58 Solana private key (memoized per key string).
+
+    Args:
+        private_key_str: base58 64-byte keypair, optionally "0x"-prefixed
+
+    Returns:
+        (Keypair, 32-byte seed) - Solana keypair format: 64 bytes = 32-byte seed + 32-byte pubkey
+    """
+    clean_key = private_key_str.replace("0x", "").strip()
+    private_key_bytes = base58.b58decode(clean_key)
+    return Keypair.from_bytes(private_key_bytes), private_key_bytes[:32]
+
 
 class StandXWebSocketManager:
     """
@@ -30,17 +156,27 @@ class StandXWebSocketManager:
     Handles connection, authentication, subscription and message dispatch
     URL: wss://perps.standx.com/ws-stream/v1
     """
-    def __init__(self, token: str, logger, on_message_callback: Callable):
+    # Reconnect delay: doubles per failed attempt up to the cap, reset after auth succeeds
+    RECONNECT_BACKOFF_MIN = 1.0
+    RECONNECT_BACKOFF_MAX = 60.0
+
+    def __init__(self, token: str, logger, on_message_callback: Callable,
+                 on_auth_failed: Optional[Callable[[], None]] = None):
         self.url = "wss://perps.standx.com/ws-stream/v1"
         self.token = token
         self.logger = logger
         self.on_message_callback = on_message_callback
+        self.on_auth_failed = on_auth_failed  # Called when the server rejects the token
+
+        # The auth frame only depends on the token, so encode it once for all reconnects
+        self._auth_frame = _json_dumps({"auth": {"token": token, "streams": _WS_STREAMS}})
 
         self._ws = None
         self._running = False
         self._task = None
         self._loop = None
         self._authenticated = False  # Track if WebSocket is authenticated and ready
+        self._backoff = self.RECONNECT_BACKOFF_MIN
 
     async def start(self):
         """Start WebSocket task"""
@@ -48,6 +184,14 @@ class StandXWebSocketManager:
         self._loop = asyncio.get_running_loop()
         self._task = self._loop.create_task(self._run_loop())
 
+    async def update_token(self, token: str):
+        """Switch to a new token and reconnect so it is used for authentication"""
+        self.token = token
+        self._auth_frame = _json_dumps({"auth": {"token": token, "streams": _WS_STREAMS}})
+        if self._ws:
+            # The receive loop sees the close and reconnects with the new auth frame
+            await self._ws.close()
+
     @property
     def is_ready(self) -> bool:
         """Check if WebSocket is connected and authenticated"""
@@ -69,104 +213,208 @@ class StandXWebSocketManager:
         while self._running:
             try:
                 self._authenticated = False  # Reset on each connection attempt
-                self.logger.info(f"[WS] Connecting to {self.url}...")
-                async with websockets.connect(self.url, ping_interval=None) as ws:
+                self.logger.info("[WS] Connecting to %s...", self.url)
+                # No permessage-deflate: order frames are small, zlib only adds CPU and latency
+                async with websockets.connect(self.url, ping_interval=None, compression=None) as ws:
                     self._ws = ws
                     self.logger.info("[WS] Connected")
+                    self._set_nodelay(ws)
 
                     # Authenticate and subscribe
                     await self._authenticate_and_subscribe()
 
+                    # Receive raw bytes where supported (websockets >= 13 asyncio client),
+                    # so text frames skip the UTF-8 decode before JSON parsing
+                    recv = ws.recv
+                    if "decode" in inspect.signature(recv).parameters:
+                        recv = functools.partial(recv, decode=False)
+
                     # Message listening loop
                     while self._running:
                         try:
-                            msg = await ws.recv()
-                            self._handle_message(msg)
+                            raw = await recv()
+                            self._handle_message(raw)
                         except websockets.ConnectionClosed:
                             self._authenticated = False
                             self.logger.warning("[WS] Connection closed by server")
                             break
                         except Exception as e:
                             self._authenticated = False
-                            self.logger.error(f"[WS] Receive error: {e}")
+                            self.logger.error("[WS] Receive error: %s", e)
                             break
 
             except Exception as e:
                 self._authenticated = False
-                self.logger.error(f"[WS] Connection error: {e}")
+                self.logger.error("[WS] Connection error: %s", e)
 
             if self._running:
-                self.logger.info("[WS] Reconnecting in 5 seconds...")
-                await asyncio.sleep(5)
+                # Jitter spreads reconnects out so clients don't retry in lockstep
+                delay = self._backoff + random.uniform(0, 0.5 * self._backoff)
+                self._backoff = min(self._backoff * 2, self.RECONNECT_BACKOFF_MAX)
+                self.logger.info("[WS] Reconnecting in %.1f seconds...", delay)
+                await asyncio.sleep(delay)
+
+    def _set_nodelay(self, ws):
+        """Disable Nagle so small frames go out without coalescing delay"""
+        # asyncio's selector loop already does this for TCP transports; set it
+        # explicitly so it holds on any event loop implementation
+        sock = ws.transport.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            self.logger.debug("[WS] Could not set TCP_NODELAY: %s", e)
 
     async def _authenticate_and_subscribe(self):
         """
         Send authentication and subscribe to order updates
         Format: {"auth": {"token": "...", "streams": [{"channel": "order"}]}}
         """
-        auth_payload = {
-            "auth": {
-                "token": self.token,
-                "streams": [
-                    {"channel": "order"}  # Subscribe to order updates
-                ]
-            }
-        }
-        await self._ws.send(json.dumps(auth_payload))
+        # Prebuilt in __init__; sent as str so it stays a text frame
+        await self._ws.send(self._auth_frame)
         self.logger.info("[WS] Sent auth & subscription")
 
-    def _handle_message(self, msg_str: str):
-        """Handle WebSocket message"""
+    def _handle_message(self, raw):
+        """Handle WebSocket message (raw frame, bytes or str)"""
         try:
-            msg = json.loads(msg_str)
+            # Fast reject: auth/order frames always carry a "channel" key, so frames
+            # without it (heartbeats etc.) are dropped with a substring scan, no parse
+            if (b'"channel"' if isinstance(raw, bytes) else '"channel"') not in raw:
+                self.logger.debug("[WS] Received: %.100s", raw)
+                return
+
+            msg = _json_loads(raw)
 
             # Handle authentication response
             if msg.get("channel") == "auth":
                 auth_data = msg.get("data", {})
                 if auth_data.get("code") == 0 or auth_data.get("message") == "success":
                     self._authenticated = True
+                    self._backoff = self.RECONNECT_BACKOFF_MIN
                     self.logger.info("[WS] Authentication successful")
                 else:
                     self._authenticated = False
-                    self.logger.error(f"[WS] Auth failed: {auth_data}")
+                    self.logger.error("[WS] Auth failed: %s", auth_data)
+                    if self.on_auth_failed:
+                        self.on_auth_failed()
                 return
 
-            # Handle order updates
+            # Handle order updates: only the consumed fields are pulled into a typed
+            # OrderUpdate, which is what the callback receives
             if msg.get("channel") == "order":
-                order_data = msg.get("data", {})
+                order_data = msg.get("data")
                 if order_data:
-                    # Log simplified order info (not full JSON)
-                    order_id = order_data.get("id", "?")
-                    status = order_data.get("status", "?")
-                    side = order_data.get("side", "?")
-                    price = order_data.get("price", "?")
-                    self.logger.info(f"[WS] Order: id={order_id} {side} ${price} status={status}")
-                    self.on_message_callback(order_data)
+                    update = OrderUpdate(order_data)
+                    # Log simplified order info (not full JSON), only if INFO is emitted
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info("[WS] Order: id=%s %s $%s status=%s",
+                                         update.order_id, update.side, update.price, update.status)
+                    self.on_message_callback(update)
                 return
 
             # Other messages (ping/pong, etc.)
-            self.logger.debug(f"[WS] Received: {str(msg)[:100]}")
+            self.logger.debug("[WS] Received: %.100s", msg)
 
         except Exception as e:
-            self.logger.error(f"[WS] Error handling message: {e}")
+            self.logger.error("[WS] Error handling message: %s", e)
 
 
 class OrderInfo:
-    """Order tracking information"""
-    def __init__(self, order_id: str, side: str, price: float, qty: float,
-                 status: str = "pending", cl_ord_id: str = None):
+    """Order tracking information (price as Decimal plus integer ticks)"""
+    __slots__ = ("order_id", "side", "price", "price_ticks", "qty", "status", "cl_ord_id", "timestamp", "flags")
+
+    def __init__(self, order_id: str, side: str, price: Decimal, qty: float,
+                 status: str = "pending", cl_ord_id: str = None, flags: int = 0):
         self.order_id = order_id
-        self.side = side
+        self.side = sys.intern(side) if side else side  # Share the "buy"/"sell" strings
         self.price = price
+        self.price_ticks = int(round(price * PRICE_TICK_SCALE))
         self.qty = qty
         self.status = status
         self.cl_ord_id = cl_ord_id
-        self.timestamp = time.time()
+        self.timestamp = time.monotonic()
+        self.flags = flags  # FLAG_* bits
+
+    @classmethod
+    def from_open_order(cls, order_id: str, data: Dict[str, Any]) -> "OrderInfo":
+        """Build from a query_open_orders row in one pass"""
+        get = data.get
+        price = get("price") or 0
+        return cls(
+            order_id=order_id,
+            side=get("side"),
+            # String prices go straight to Decimal; numbers via str to keep their repr
+            price=Decimal(price if isinstance(price, str) else str(price)),
+            qty=float(get("qty") or get("size") or 0),
+            status=get("status", "open"),
+            cl_ord_id=get("cl_ord_id")
+        )
+
+
+class OrderUpdate:
+    """Typed view of a WebSocket order update, converted in a single pass"""
+    __slots__ = ("order_id", "status", "side", "price", "cl_ord_id", "filled_qty")
+
+    def __init__(self, data: Dict[str, Any]):
+        get = data.get
+        order_id = get("id") or get("order_id")
+        # Convert order_id to string for consistent comparison
+        self.order_id = str(order_id) if order_id else None
+        self.status = get("status", "").lower()
+        self.side = get("side", "")
+        self.price = float(get("price") or 0)
+        self.cl_ord_id = get("cl_ord_id", "")
+        # Fix: StandX uses "fill_qty" not "filled_qty"
+        self.filled_qty = float(get("fill_qty") or get("filled_qty") or get("filled_size") or 0)
+
+
+class QuoteBuffer:
+    """
+    Collects quote placements and cancels and sends them together on flush():
+    all cancels in one cancel_orders request, then placements concurrently
+    in chunks of max_batch. Obtain via StandXMarketMaker.buffered_quotes().
+    """
+    def __init__(self, maker: "StandXMarketMaker", max_batch: int = 16):
+        self._maker = maker
+        self._max_batch = max_batch
+        self._places: List[Tuple[str, float, Optional[float]]] = []
+        self._cancels: List[str] = []
+        # Placement results in queue order: OrderInfo, None (failed) or the raised exception
+        self.results: List[Any] = []
+
+    def queue_place(self, side: str, price: float, qty: float = None):
+        """Queue a limit order placement"""
+        self._places.append((side, price, qty))
+
+    def queue_cancel(self, order_id: str):
+        """Queue an order cancel"""
+        self._cancels.append(order_id)
+
+    async def flush(self):
+        """Send everything queued so far"""
+        cancels, self._cancels = self._cancels, []
+        places, self._places = self._places, []
+
+        if cancels:
+            await self._maker.cancel_orders(cancels)
+
+        for i in range(0, len(places), self._max_batch):
+            chunk = places[i:i + self._max_batch]
+            self.results.extend(await asyncio.gather(
+                *(self._maker.place_order(side, price, qty) for side, price, qty in chunk),
+                return_exceptions=True
+            ))
 
 
 class StandXMarketMaker:
     """StandX Market Making Bot - Based on cross-exchange-arbitrage implementation"""
 
+    # Most recent filled order IDs remembered for duplicate-fill detection
+    PROCESSED_FILLS_MAX = 1000
+    # Max IDs per cancel_orders request; larger cancels are split and sent concurrently
+    CANCEL_BATCH_SIZE = 50
+
     def __init__(self, config):
         """
         Initialize market maker.
@@ -178,6 +426,16 @@ class StandXMarketMaker:
         self.symbol = config.get("trading.symbol", "BTC-USD")
         self.spread_pct = config.get("trading.spread_percentage", 0.1) / 100.0
         self.order_size = config.get("trading.order_size", "0.01")
+        # Wire formats prepared once for the quoting hot path
+        self._default_qty = float(self.order_size)
+        self._default_qty_str = str(self.order_size)
+        self.price_decimals = int(config.get("trading.price_decimals", 1))
+        self._price_fmt = f".{self.price_decimals}f"
+        # Exchange tick size in units of the last price decimal (e.g. 0.5 @ 1 decimal -> 5).
+        # No symbol-info endpoint exposes it, so it comes from config (defaults to one unit).
+        self._price_scale = 10 ** self.price_decimals
+        price_tick = config.get("trading.price_tick") or 10 ** -self.price_decimals
+        self._price_tick_units = max(1, int(round(float(price_tick) * self._price_scale)))
         self.leverage = config.get("trading.leverage", 1)
         self.margin_mode = config.get("trading.margin_mode", "cross")
         self.check_interval = config.get("trading.check_interval_seconds", 5)
@@ -187,37 +445,55 @@ class StandXMarketMaker:
         self.base_url = os.getenv('STANDX_BASE_URL') or config.get("exchanges.standx.trade_url", "https://perps.standx.com")
         self.auth_url = os.getenv('STANDX_AUTH_URL') or config.get("exchanges.standx.auth_url", "https://api.standx.com")
 
+        # Shared keep-alive session for all StandX REST calls (auth + trading hosts)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount(self.auth_url, adapter)
+        self._session.mount(self.base_url, adapter)
+        self._session.headers.update({"Connection": "keep-alive"})
+
         # Initialize StandX clients
-        self.http_client = StandXPerpHTTP(base_url=self.base_url)
+        self.http_client = StandXPerpHTTP(base_url=self.base_url, session=self._session)
 
         # Load Solana wallet FIRST
-        private_key_str = config.get_solana_private_key()
-        clean_key = private_key_str.replace("0x", "").strip()
-        private_key_bytes = base58.b58decode(clean_key)
-        self.keypair = Keypair.from_bytes(private_key_bytes)
+        self.keypair, solana_seed = _load_keypair(config.get_solana_private_key())
         self.wallet_address = str(self.keypair.pubkey())
+        # Keypair-derived values reused by every login
+        self._pubkey_bytes = bytes(self.keypair.pubkey())
+        self._pubkey_json = _json_byte_array(self._pubkey_bytes)  # Pre-encoded for _SIG_TEMPLATE
 
         # Initialize auth client with Solana private key seed (first 32 bytes)
-        # Solana keypair format: 64 bytes = 32-byte seed + 32-byte pubkey
-        solana_seed = private_key_bytes[:32]
-        self.auth_client = StandXAuth(private_key=solana_seed)
+        self.auth_client = StandXAuth(private_key=solana_seed, session=self._session)
+
+        # Client order IDs: "<side>_<startup wall-clock ms>_<seq>" - the startup stamp keeps
+        # IDs unique across restarts, the counter keeps them unique within a run
+        self._cl_ord_base = int(time.time() * 1000)
+        self._cl_ord_seq = itertools.count()
 
         # Authentication token
         self.token = None
+        # Serializes re-login after the server rejects the token (REST 401 / WS auth failure)
+        self._login_lock = asyncio.Lock()
+        self._relogin_task = None
+        # Ignore the on-disk token cache and always sign in
+        self.force_relogin = config.get("exchanges.standx.force_relogin", False)
 
         # WebSocket manager
         self.ws_manager = None
         self._order_update_handler = None
 
-        # Track active orders
+        # Track active orders (mutate via _add_order/_remove_order to keep the indexes in step)
         self.active_orders: Dict[str, OrderInfo] = {}
+        # Secondary index: cl_ord_id -> OrderInfo
+        self._by_cl_ord_id: Dict[str, OrderInfo] = {}
+        # (price_ticks, order_id) sorted by price for nearest-order lookups; entries are
+        # inserted/deleted with active_orders
+        self._price_index: List[Tuple[int, str]] = []
 
-        # Track processed fills to prevent duplicate hedge triggers
-        self.processed_fills: set = set()
-
-        # Track close orders (orders that are closing positions, not opening)
-        # These should NOT trigger hedges when filled
-        self.close_order_ids: set = set()
+        # Track processed fills to prevent duplicate hedge triggers. Kept apart from
+        # OrderInfo because a filled order is dropped from tracking but may be re-added by sync
+        # Insertion-ordered, so the oldest entry is evicted in O(1) once the cap is reached
+        self.processed_fills: "OrderedDict[str, None]" = OrderedDict()
 
         # Order status callbacks
         self._order_confirm_handler = None  # Called when order is confirmed (open)
@@ -226,30 +502,21 @@ class StandXMarketMaker:
         # Current market price
         self.current_price = None
 
-        logger.info(f"Initialized StandX Market Maker for {self.symbol}")
-        logger.info(f"Wallet: {self.wallet_address[:10]}...")
+        logger.info("Initialized StandX Market Maker for %s", self.symbol)
+        logger.info("Wallet: %.10s...", self.wallet_address)
 
     def construct_solana_signature(self, jwt_payload: Dict, raw_sig: bytes, msg_bytes: bytes) -> str:
         """Construct Solana signature for StandX authentication"""
-        input_data = {
-            "domain": jwt_payload.get("domain"),
-            "address": jwt_payload.get("address"),
-            "statement": jwt_payload.get("statement"),
-            "uri": jwt_payload.get("uri"),
-            "version": jwt_payload.get("version"),
-            "chainId": jwt_payload.get("chainId"),
-            "nonce": jwt_payload.get("nonce"),
-            "issuedAt": jwt_payload.get("issuedAt"),
-            "requestId": jwt_payload.get("requestId")
-        }
-        output_data = {
-            "account": {"publicKey": list(bytes(self.keypair.pubkey()))},
-            "signature": list(raw_sig),
-            "signedMessage": list(msg_bytes)
-        }
-        complex_obj = {"input": input_data, "output": output_data}
-        json_str = json.dumps(complex_obj, separators=(',', ':'))
-        return base64.b64encode(json_str.encode('utf-8')).decode('utf-8')
+        # StandX verifies the Solana wallet-adapter output shape, where the key,
+        # signature and message are JSON arrays of byte values (no base64 form is
+        # documented). Only the variable parts are encoded; the rest is _SIG_TEMPLATE.
+        payload = _SIG_TEMPLATE.format(
+            input=_json_dumps({field: jwt_payload.get(field) for field in _SIG_INPUT_FIELDS}),
+            public_key=self._pubkey_json,
+            signature=_json_byte_array(raw_sig),
+            message=_json_byte_array(msg_bytes)
+        )
+        return base64.b64encode(payload.encode('utf-8')).decode('ascii')
 
     async def connect(self) -> bool:
         """
@@ -271,37 +538,54 @@ class StandXMarketMaker:
             return True
 
         except Exception as e:
-            logger.error(f"StandX connection failed: {e}")
+            logger.error("StandX connection failed: %s", e)
             return False
 
+    def _load_cached_token(self) -> Optional[str]:
+        """Return the cached token for this wallet if it is still valid, else None"""
+        return load_cached_token(self.wallet_address, self.auth_url)
+
+    def _save_cached_token(self, token: str, issued_at: float):
+        """Persist the login token (owner-only permissions)"""
+        save_cached_token(token, self.wallet_address, self.auth_url, issued_at)
+
     def _perform_login(self):
         """Synchronous login logic with retry"""
+        # Reuse a still-valid token from a previous run
+        if not self.force_relogin:
+            token = self._load_cached_token()
+            if token:
+                self.token = token
+                logger.info("StandX login skipped, using cached token")
+                return
+
         max_retries = 3
-        retry_delay = 2
+        retry_delay = 2  # Base delay, doubled per attempt with jitter
 
         for attempt in range(max_retries):
             try:
                 # 1. Prepare signin
-                req_id = str(self.keypair.pubkey())
-                logger.info(f"Attempting to connect to StandX API (attempt {attempt + 1}/{max_retries})...")
-                resp = requests.post(
+                req_id = self.wallet_address  # String form of the pubkey
+                logger.info("Attempting to connect to StandX API (attempt %s/%s)...", attempt + 1, max_retries)
+                resp = self._session.post(
                     f"{self.auth_url}/v1/offchain/prepare-signin?chain=solana",
-                    json={"address": self.wallet_address, "requestId": req_id},
+                    data=_json_dumps_bytes({"address": self.wallet_address, "requestId": req_id}),
+                    headers=_JSON_HEADERS,
                     timeout=30  # Increased from 10 to 30 seconds
                 )
                 if not resp.ok:
                     raise ValueError(f"Prepare failed: {resp.text}")
 
-                data = resp.json()
+                data = _json_loads(resp.content)
                 if not data.get("success"):
                     raise ValueError(f"API Error: {data.get('message')}")
 
                 signed_data_jwt = data["signedData"]
 
                 # 2. Parse JWT & Sign
-                parts = signed_data_jwt.split('.')
-                padded = parts[1] + '=' * (4 - len(parts[1]) % 4)
-                jwt_payload = json.loads(base64.b64decode(padded).decode('utf-8'))
+                # JWT segments are unpadded base64url ('-'/'_' alphabet)
+                payload_b64 = signed_data_jwt.split('.')[1]
+                jwt_payload = _json_loads(base64.urlsafe_b64decode(payload_b64 + '=' * (-len(payload_b64) % 4)))
 
                 msg_bytes = jwt_payload.get("message").encode('utf-8')
                 raw_sig = bytes(self.keypair.sign_message(msg_bytes))
@@ -310,69 +594,104 @@ class StandXMarketMaker:
                 final_sig = self.construct_solana_signature(jwt_payload, raw_sig, msg_bytes)
 
                 # 4. Login
-                resp = requests.post(
+                issued_at = time.time()
+                resp = self._session.post(
                     f"{self.auth_url}/v1/offchain/login?chain=solana",
-                    json={
+                    data=_json_dumps_bytes({
                         "signature": final_sig,
                         "signedData": signed_data_jwt,
-                        "expiresSeconds": 604800
-                    },
+                        "expiresSeconds": TOKEN_EXPIRES_SECONDS
+                    }),
+                    headers=_JSON_HEADERS,
                     timeout=30  # Increased from 10 to 30 seconds
                 )
                 if not resp.ok:
                     raise ValueError(f"Login failed: {resp.text}")
 
-                result = resp.json()
+                result = _json_loads(resp.content)
                 self.token = result.get("token")
                 if not self.token:
                     raise ValueError(f"Login failed: no token in response")
 
-                logger.info(f"StandX Login Success (Address: {result.get('address', 'N/A')})")
+                logger.info("StandX Login Success (Address: %s)", result.get('address', 'N/A'))
+                self._save_cached_token(self.token, issued_at)
                 return  # Success, exit retry loop
 
             except requests.exceptions.Timeout as e:
                 if attempt < max_retries - 1:
-                    logger.warning(f"Connection timeout (attempt {attempt + 1}/{max_retries}), retrying in {retry_delay}s...")
-                    import time
-                    time.sleep(retry_delay)
+                    delay = self._retry_delay(retry_delay, attempt)
+                    logger.warning("Connection timeout (attempt %s/%s), retrying in %.1fs...", attempt + 1, max_retries, delay)
+                    time.sleep(delay)
                 else:
                     raise ValueError(f"Failed to connect to StandX after {max_retries} attempts: {e}")
             except Exception as e:
                 if attempt < max_retries - 1:
-                    logger.warning(f"Connection failed (attempt {attempt + 1}/{max_retries}): {e}, retrying in {retry_delay}s...")
-                    import time
-                    time.sleep(retry_delay)
+                    delay = self._retry_delay(retry_delay, attempt)
+                    logger.warning("Connection failed (attempt %s/%s): %s, retrying in %.1fs...", attempt + 1, max_retries, e, delay)
+                    time.sleep(delay)
                 else:
                     raise
 
+    async def _relogin(self, rejected_token: str):
+        """
+        Sign in again after the server rejected rejected_token, then move the
+        WebSocket to the new token. Only the first caller for a given token signs in.
+        """
+        async with self._login_lock:
+            if self.token != rejected_token:
+                return
+            logger.warning("StandX token rejected, signing in again")
+            clear_cached_token()
+            try:
+                await asyncio.to_thread(self._perform_login)
+            except Exception as e:
+                logger.error("StandX re-login failed: %s", e)
+                return
+            if self.ws_manager:
+                await self.ws_manager.update_token(self.token)
+
+    async def _handle_request_error(self, e: Exception, token: str):
+        """Re-login if the server rejected token (StandXPerpHTTP raises 'HTTP 401: ...')"""
+        if str(e).startswith("HTTP 401"):
+            await self._relogin(token)
+
+    def _on_ws_auth_failed(self):
+        """WebSocket auth rejection callback: re-login in the background"""
+        if self._relogin_task is None or self._relogin_task.done():
+            self._relogin_task = asyncio.get_running_loop().create_task(
+                self._relogin(self.ws_manager.token)
+            )
+
+    @staticmethod
+    def _retry_delay(base: float, attempt: int) -> float:
+        """Exponential backoff with up to 50% jitter for the given (0-based) attempt"""
+        delay = base * (2 ** attempt)
+        return delay + random.uniform(0, 0.5 * delay)
+
     async def _start_websocket(self):
         """Start WebSocket connection"""
         if self.token:
             self.ws_manager = StandXWebSocketManager(
                 token=self.token,
                 logger=logger,
-                on_message_callback=self._on_ws_order_update
+                on_message_callback=self._on_ws_order_update,
+                on_auth_failed=self._on_ws_auth_failed
             )
             await self.ws_manager.start()
 
-    def _on_ws_order_update(self, order_data: dict):
-        """WebSocket order update callback"""
+    def _on_ws_order_update(self, update: "OrderUpdate"):
+        """WebSocket order update callback (update is parsed by the WebSocket manager)"""
         try:
-            order_id = order_data.get("id") or order_data.get("order_id")
+            order_id = update.order_id
             if not order_id:
-                logger.warning(f"[WS] Order update missing order_id")
+                logger.warning("[WS] Order update missing order_id")
                 return
 
-            # Convert order_id to string for consistent comparison
-            order_id = str(order_id)
-
-            status = order_data.get("status", "").lower()
-            side = order_data.get("side", "")
-            price = float(order_data.get("price", 0))
-            qty = float(order_data.get("qty", 0) or order_data.get("size", 0))
-            cl_ord_id = order_data.get("cl_ord_id", "")
-            # Fix: StandX uses "fill_qty" not "filled_qty"
-            filled_qty = float(order_data.get("fill_qty", 0) or order_data.get("filled_qty", 0) or order_data.get("filled_size", 0))
+            status = update.status
+            side = update.side
+            price = update.price
+            cl_ord_id = update.cl_ord_id
+            filled_qty = update.filled_qty
 
             # Handle order confirmed (open status) - notify state machine
             if status == "open" and self._order_confirm_handler:
@@ -392,56 +711,48 @@ class StandXMarketMaker:
                 if filled_qty > 0:
                     # Check if we've already processed this fill to prevent duplicate hedges
                     if order_id in self.processed_fills:
-                        logger.debug(f"Order {order_id} already processed, skipping duplicate fill trigger")
+                        logger.debug("Order %s already processed, skipping duplicate fill trigger", order_id)
                         # Still remove from active orders if needed
-                        if order_id in self.active_orders:
-                            del self.active_orders[order_id]
+                        self._remove_order(order_id)
                         return
 
                     # Mark as processed
-                    self.processed_fills.add(order_id)
+                    self.processed_fills[order_id] = None
+                    if len(self.processed_fills) > self.PROCESSED_FILLS_MAX:
+                        self.processed_fills.popitem(last=False)
 
                     fill_value = filled_qty * price
-                    logger.info(f"✓ FILLED: {side.upper()} {filled_qty} {self.symbol} @ ${price:,.2f} (${fill_value:,.2f})")
+                    logger.info("✓ FILLED: %s %s %s @ $%.2f ($%.2f)", side.upper(), filled_qty, self.symbol, price, fill_value)
 
                     # Check if this is a close order (should NOT trigger hedge)
-                    if order_id in self.close_order_ids:
-                        logger.info(f"Order {order_id} is a close order, NOT triggering hedge")
-                        # Remove from close_order_ids tracking
-                        self.close_order_ids.discard(order_id)
+                    if order_info.flags & FLAG_CLOSE:
+                        logger.info("Order %s is a close order, NOT triggering hedge", order_id)
                         # Remove from active orders
-                        del self.active_orders[order_id]
+                        self._remove_order(order_id)
                         return
 
                     # This is a market-making order, trigger hedge
                     if self._order_update_handler:
-                        logger.info(f"Triggering hedge for order {order_id}")
-                        # Schedule async callback properly
-                        import asyncio
-                        asyncio.create_task(self._order_update_handler({
-                            "order_id": order_id,
-                            "side": side,
-                            "price": price,
-                            "qty": filled_qty,
-                            "status": "filled"
-                        }))
+                        logger.info("Triggering hedge for order %s", order_id)
+                        # Hand over the already-parsed update, no per-fill event dict
+                        result = self._order_update_handler(update)
+                        # Async handlers are scheduled; sync handlers (e.g. enqueue) already ran
+                        if asyncio.iscoroutine(result):
+                            asyncio.create_task(result)
                     else:
                         logger.warning("No order update handler registered!")
                     # Remove from active orders
-                    del self.active_orders[order_id]
+                    self._remove_order(order_id)
                 elif status in ["cancelled", "canceled", "rejected"]:
                     # Only remove if no fills (filled_qty == 0)
                     # This prevents removing orders that were filled during cancellation
-                    if order_id in self.active_orders:
-                        del self.active_orders[order_id]
-                    # Also clean up from close_order_ids if it was a close order
-                    self.close_order_ids.discard(order_id)
+                    self._remove_order(order_id)
 
         except Exception as e:
-            logger.error(f"Error processing order update: {e}", exc_info=True)
+            logger.error("Error processing order update: %s", e, exc_info=True)
 
     def setup_order_update_handler(self, handler: Callable):
-        """Setup callback for order fills"""
+        """Setup callback for order fills (plain function or coroutine function taking an OrderUpdate)"""
         self._order_update_handler = handler
 
     def setup_order_confirm_handler(self, handler: Callable):
@@ -460,8 +771,16 @@ class StandXMarketMaker:
         Args:
             order_id: The order ID to mark as close order
         """
-        self.close_order_ids.add(str(order_id))
-        logger.debug(f"Marked order {order_id} as close order (will not trigger hedge)")
+        order_info = self.active_orders.get(str(order_id))
+        if order_info is None:
+            logger.warning("Cannot mark untracked order %s as close order", order_id)
+            return
+        order_info.flags |= FLAG_CLOSE
+        logger.debug("Marked order %s as close order (will not trigger hedge)", order_id)
+
+    async def fetch_ticker(self, symbol: str = None) -> dict:
+        """Get current ticker data (BBO) without blocking the event loop"""
+        return await asyncio.to_thread(self.get_ticker, symbol)
 
     def get_ticker(self, symbol: str = None) -> dict:
         """Get current ticker data (BBO)"""
@@ -469,20 +788,20 @@ class StandXMarketMaker:
             symbol = symbol or self.symbol
             url = f"{self.base_url}/api/query_symbol_price"
             params = {"symbol": symbol}
-            resp = requests.get(url, params=params, timeout=5)
+            resp = self._session.get(url, params=params, timeout=5)
 
             if not resp.ok:
-                logger.error(f"Failed to get ticker: {resp.status_code}")
+                logger.error("Failed to get ticker: %s", resp.status_code)
                 return {"bid_price": 0, "ask_price": 0}
 
-            data = resp.json()
+            data = _json_loads(resp.content)
             return {
                 "bid_price": data.get("spread_bid", 0) or 0,
                 "ask_price": data.get("spread_ask", 0) or 0,
                 "mark_price": data.get("mark_price", 0) or 0
             }
         except Exception as e:
-            logger.error(f"Error getting ticker: {e}")
+            logger.error("Error getting ticker: %s", e)
             return {"bid_price": 0, "ask_price": 0}
 
     async def place_order(self, side: str, price: float, qty: float = None) -> Optional[OrderInfo]:
@@ -497,18 +816,29 @@ class StandXMarketMaker:
         Returns:
             OrderInfo if successful, None otherwise
         """
+        token = self.token
         try:
-            qty = qty or float(self.order_size)
-            cl_ord_id = f"{side}_{int(time.time() * 1000)}"
-
-            # Use http_client.place_order() with auth for request signing
-            response = self.http_client.place_order(
-                token=self.token,
+            if not qty or qty == self._default_qty:
+                qty, qty_str = self._default_qty, self._default_qty_str
+            else:
+                # Fixed-point with float noise trimmed: str() can give "1e-05" or "0.30000000000000004"
+                qty_str = format(qty, ".8f").rstrip("0").rstrip(".")
+            # Snap to the exchange tick in integer units so off-grid prices are never sent
+            step = self._price_tick_units
+            units = int(round(price * self._price_scale / step)) * step
+            price_str = format(units / self._price_scale, self._price_fmt)
+            cl_ord_id = f"{side}_{self._cl_ord_base}_{next(self._cl_ord_seq)}"
+
+            # Use http_client.place_order() with auth for request signing; runs in a
+            # worker thread so the event loop keeps draining WebSocket frames meanwhile
+            response = await asyncio.to_thread(
+                self.http_client.place_order,
+                token=token,
                 symbol=self.symbol,
                 side=side,
                 order_type="limit",
-                qty=str(qty),
-                price=str(price),
+                qty=qty_str,
+                price=price_str,
                 time_in_force="gtc",
                 reduce_only=False,
                 cl_ord_id=cl_ord_id,
@@ -516,7 +846,7 @@ class StandXMarketMaker:
             )
 
             # Log order placement with trading details
-            logger.info(f"Order placed: {side.upper()} {qty} {self.symbol} @ ${price}")
+            logger.info("Order placed: %s %s %s @ $%s", side.upper(), qty, self.symbol, price)
 
             # Extract order ID from response
             order_id = str(response.get("request_id", cl_ord_id))
@@ -524,18 +854,37 @@ class StandXMarketMaker:
             order_info = OrderInfo(
                 order_id=order_id,
                 side=side,
-                price=price,
+                price=Decimal(price_str),
                 qty=qty,
                 cl_ord_id=cl_ord_id
             )
 
-            self.active_orders[order_id] = order_info
+            self._add_order(order_info)
             return order_info
 
         except Exception as e:
-            logger.error(f"Failed to place {side} order: {e}")
+            logger.error("Failed to place %s order: %s", side, e)
+            await self._handle_request_error(e, token)
             return None
 
+    @contextlib.asynccontextmanager
+    async def buffered_quotes(self, max_batch: int = 16):
+        """
+        Buffer quote placements/cancels and send them together on exit.
+
+        Usage:
+            async with maker.buffered_quotes() as quotes:
+                quotes.queue_place("buy", bid, qty)
+                quotes.queue_place("sell", ask, qty)
+            results = quotes.results
+
+        Args:
+            max_batch: Max placements sent concurrently
+        """
+        buffer = QuoteBuffer(self, max_batch)
+        yield buffer
+        await buffer.flush()
+
     async def cancel_orders(self, order_ids: List[str] = None, exclude_close_order: bool = False) -> bool:
         """
         Cancel orders by ID list
@@ -547,93 +896,182 @@ class StandXMarketMaker:
         Returns:
             True if successful
         """
+        token = self.token
         try:
             if order_ids is None:
                 order_ids = list(self.active_orders.keys())
 
             # Exclude close orders if requested
-            if exclude_close_order and self.close_order_ids:
-                order_ids = [oid for oid in order_ids if oid not in self.close_order_ids]
+            if exclude_close_order:
+                active = self.active_orders
+                order_ids = [oid for oid in order_ids
+                             if oid not in active or not active[oid].flags & FLAG_CLOSE]
 
             if not order_ids:
                 return True
 
-            # Convert to integers if needed
-            order_id_list = []
+            # Numeric keys are exchange order IDs; other keys (e.g. the request_id UUID a
+            # placement is tracked under until WS reports the order ID) cancel by cl_ord_id
+            active = self.active_orders
+            order_id_list = []  # (exchange order ID, tracking key)
+            cl_ord_id_list = []  # (cl_ord_id, tracking key)
             for oid in order_ids:
                 try:
-                    order_id_list.append(int(oid))
+                    order_id_list.append((int(oid), oid))
                 except ValueError:
-                    # If conversion fails, might be cl_ord_id
-                    pass
-
-            if order_id_list:
-                self.http_client.cancel_orders(
-                    token=self.token,
-                    order_id_list=order_id_list,
-                    auth=self.auth_client
+                    order_info = active.get(oid)
+                    cl_ord_id = order_info.cl_ord_id if order_info is not None and order_info.cl_ord_id else oid
+                    cl_ord_id_list.append((cl_ord_id, oid))
+
+            size = self.CANCEL_BATCH_SIZE
+            batches = [
+                ("order_id_list", order_id_list[i:i + size])
+                for i in range(0, len(order_id_list), size)
+            ] + [
+                ("cl_ord_id_list", cl_ord_id_list[i:i + size])
+                for i in range(0, len(cl_ord_id_list), size)
+            ]
+            results = await asyncio.gather(*(
+                asyncio.to_thread(
+                    self.http_client.cancel_orders,
+                    token=token,
+                    auth=self.auth_client,
+                    **{field: [ident for ident, _ in batch]}
                 )
-                logger.info(f"Cancelled {len(order_id_list)} orders")
-
-            # Remove from tracking
-            for oid in order_ids:
-                if oid in self.active_orders:
-                    del self.active_orders[oid]
-
+                for field, batch in batches
+            ), return_exceptions=True)
+
+            # Stop tracking the orders of each batch that went through
+            cancelled = 0
+            error = None
+            for (field, batch), result in zip(batches, results):
+                if isinstance(result, BaseException):
+                    logger.error("Failed to cancel %s orders by %s: %s", len(batch), field, result)
+                    error = error or result
+                    continue
+                for _, oid in batch:
+                    self._remove_order(oid)
+                cancelled += len(batch)
+            logger.info("Cancelled %s/%s orders", cancelled, len(order_ids))
+
+            if error is not None:
+                await self._handle_request_error(error, token)
+                return False
             return True
 
         except Exception as e:
-            logger.error(f"Failed to cancel orders: {e}")
+            logger.error("Failed to cancel orders: %s", e)
+            await self._handle_request_error(e, token)
             return False
 
+    def _add_order(self, order_info: OrderInfo):
+        """Track an order in active_orders and its indexes (replaces an order with the same ID)"""
+        if order_info.order_id in self.active_orders:
+            self._remove_order(order_info.order_id)
+        self.active_orders[order_info.order_id] = order_info
+        if order_info.cl_ord_id:
+            self._by_cl_ord_id[order_info.cl_ord_id] = order_info
+        bisect.insort(self._price_index, (order_info.price_ticks, order_info.order_id))
+
+    def _remove_order(self, order_id: str) -> Optional[OrderInfo]:
+        """Stop tracking an order and drop it from the indexes (no-op if unknown)"""
+        order_info = self.active_orders.pop(order_id, None)
+        if order_info is None:
+            return None
+        if self._by_cl_ord_id.get(order_info.cl_ord_id) is order_info:
+            del self._by_cl_ord_id[order_info.cl_ord_id]
+        key = (order_info.price_ticks, order_id)
+        index = self._price_index
+        i = bisect.bisect_left(index, key)
+        if i < len(index) and index[i] == key:
+            del index[i]
+        return order_info
+
+    def get_order_by_cl_ord_id(self, cl_ord_id: str) -> Optional[OrderInfo]:
+        """Look up an active order by client order ID"""
+        return self._by_cl_ord_id.get(cl_ord_id)
+
+    def nearest_order(self, price_ticks: int, exclude_order_id: Optional[str] = None) -> Optional[OrderInfo]:
+        """
+        Find the active order whose price is closest to the given price.
+
+        Args:
+            price_ticks: Reference price in ticks (e.g. mark price)
+            exclude_order_id: Order ID to ignore (e.g. the close order)
+
+        Returns:
+            Closest OrderInfo, or None if there are no other active orders
+        """
+        index = self._price_index
+        hi = bisect.bisect_left(index, (price_ticks,))
+        lo = hi - 1
+        n = len(index)
+        # Walk outward from the insertion point, nearest price first
+        while lo >= 0 or hi < n:
+            if hi >= n or (lo >= 0 and price_ticks - index[lo][0] <= index[hi][0] - price_ticks):
+                order_id = index[lo][1]
+                lo -= 1
+            else:
+                order_id = index[hi][1]
+                hi += 1
+            if order_id != exclude_order_id:
+                order_info = self.active_orders.get(order_id)
+                if order_info is not None:
+                    return order_info
+        return None
+
     async def sync_open_orders(self):
         """Sync active orders with exchange"""
+        token = self.token
         try:
-            open_orders_data = self.http_client.query_open_orders(
-                token=self.token,
+            open_orders_data = await asyncio.to_thread(
+                self.http_client.query_open_orders,
+                token=token,
                 symbol=self.symbol
             )
 
             result = open_orders_data.get("result", [])
 
-            # Update our tracking
-            new_active_orders = {}
+            # Update our tracking by diff: keep known orders, add new ones, drop missing ones
+            active = self.active_orders
+            seen = set()
             for order_data in result:
-                order_id = str(order_data.get("id") or order_data.get("order_id"))
-                if order_id:
-                    order_info = OrderInfo(
-                        order_id=order_id,
-                        side=order_data.get("side"),
-                        price=float(order_data.get("price", 0)),
-                        qty=float(order_data.get("qty", 0) or order_data.get("size", 0)),
-                        status=order_data.get("status", "open"),
-                        cl_ord_id=order_data.get("cl_ord_id")
-                    )
-                    new_active_orders[order_id] = order_info
-
-            self.active_orders = new_active_orders
-            logger.debug(f"Synced {len(self.active_orders)} open orders")
-
-            # Clean up processed_fills set - keep only recent entries (last 1000)
-            # This prevents memory leak from accumulating order IDs
-            if len(self.processed_fills) > 1000:
-                # Convert to list, keep last 500, convert back to set
-                recent_fills = list(self.processed_fills)[-500:]
-                self.processed_fills = set(recent_fills)
-                logger.debug(f"Cleaned up processed_fills, kept {len(self.processed_fills)} recent entries")
-
-            # Clean up close_order_ids - remove orders that are no longer active
-            active_order_ids = set(self.active_orders.keys())
-            self.close_order_ids = self.close_order_ids.intersection(active_order_ids)
+                raw_id = order_data.get("id") or order_data.get("order_id")
+                if not raw_id:
+                    continue
+                order_id = str(raw_id)
+                seen.add(order_id)
+
+                existing = active.get(order_id)
+                if existing is not None:
+                    # Side/price are fixed for an order id, status and qty are updated in place
+                    existing.status = order_data.get("status", "open")
+                    qty = order_data.get("qty") or order_data.get("size")
+                    if qty:
+                        existing.qty = float(qty)
+                    continue
+
+                self._add_order(OrderInfo.from_open_order(order_id, order_data))
+
+            missing = [order_id for order_id in active if order_id not in seen]
+            for order_id in missing:
+                self._remove_order(order_id)
+            if len(self._price_index) != len(active):
+                # Safety net: the index should mirror active_orders exactly, rebuild if it drifted
+                self._price_index = sorted((o.price_ticks, oid) for oid, o in active.items())
+            logger.debug("Synced %s open orders", len(self.active_orders))
 
         except Exception as e:
-            logger.error(f"Failed to sync orders: {e}")
+            logger.error("Failed to sync orders: %s", e)
+            await self._handle_request_error(e, token)
 
     async def get_position(self) -> Decimal:
         """Get current position quantity"""
+        token = self.token
         try:
-            positions = self.http_client.query_positions(
-                token=self.token,
+            positions = await asyncio.to_thread(
+                self.http_client.query_positions,
+                token=token,
                 symbol=self.symbol
             )
 
@@ -645,11 +1083,15 @@ class StandXMarketMaker:
             return Decimal('0')
 
         except Exception as e:
-            logger.error(f"Failed to get position: {e}")
+            logger.error("Failed to get position: %s", e)
+            await self._handle_request_error(e, token)
             return Decimal('0')
 
     async def disconnect(self):
         """Disconnect from StandX"""
+        if self._relogin_task and not self._relogin_task.done():
+            self._relogin_task.cancel()
         if self.ws_manager:
             await self.ws_manager.stop()
+        self._session.close()
         logger.info("Disconnected from StandX")
@@ -5,13 +5,19 @@ Based on cross-exchange-arbitrage project implementation
 """
 import sys
 import os
+import math
+import signal
+import threading
 import time
 import base58
+import itertools
 import base64
 import json
 import asyncio
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Tuple, Callable
 from decimal import Decimal
 from solders.keypair import Keypair
@@ -21,26 +27,59 @@ import websockets
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 try:
-    from DD_strategy_bot.exchange.exchange_standx.standx_protocol.perp_http import StandXPerpHTTP
-    from DD_strategy_bot.exchange.exchange_standx.standx_protocol.perps_auth import StandXAuth
+    # This project's own protocol modules (support a shared requests.Session)
+    from standx_protocol.perp_http import StandXPerpHTTP
+    from standx_protocol.perps_auth import StandXAuth
 except ImportError:
-    # Fallback to cross-exchange-arbitrage location
-    sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'cross-exchange-arbitrage'))
-    from exchanges.standx_protocol.perp_http import StandXPerpHTTP
-    from exchanges.standx_protocol.perps_auth import StandXAuth
+    try:
+        from DD_strategy_bot.exchange.exchange_standx.standx_protocol.perp_http import StandXPerpHTTP
+        from DD_strategy_bot.exchange.exchange_standx.standx_protocol.perps_auth import StandXAuth
+    except ImportError:
+        # Fallback to cross-exchange-arbitrage location
+        sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'cross-exchange-arbitrage'))
+        from exchanges.standx_protocol.perp_http import StandXPerpHTTP
+        from exchanges.standx_protocol.perps_auth import StandXAuth
 
 from config_loader import get_config
+# Token cache shared with the main bot (same file, keyed by wallet and auth host)
+from standx_client import (
+    TOKEN_EXPIRES_SECONDS, load_cached_token, save_cached_token, clear_cached_token
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Optional fast JSON codec for the login path (loads accepts str or bytes)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps_bytes = orjson.dumps  # Compact, UTF-8 bytes
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# Prices are also carried as integer ticks of 1/PRICE_TICK_SCALE for fast comparisons
+# (same scale as standx_client.PRICE_TICK_SCALE)
+PRICE_TICK_SCALE = 100
+
+
+def _to_ticks(price: float) -> int:
+    """Convert a price to integer ticks of 1/PRICE_TICK_SCALE"""
+    return int(round(price * PRICE_TICK_SCALE))
+
 
 class OrderInfo:
     """Order tracking information"""
+    __slots__ = ("order_id", "side", "price", "price_ticks", "qty", "cl_ord_id", "timestamp")
+
     def __init__(self, order_id: int, side: str, price: float, qty: float, cl_ord_id: str = None):
         self.order_id = order_id
         self.side = side
         self.price = price
+        self.price_ticks = _to_ticks(price)
         self.qty = qty
         self.cl_ord_id = cl_ord_id
         self.timestamp = time.time()
@@ -65,11 +104,21 @@ class StandXMarketMaker:
         self.check_interval = config.get("trading.check_interval_seconds", 5)
         self.cancel_threshold = config.get("strategy.cancel_distance_percentage", 0.05) / 100.0
 
+        # Shared keep-alive session: login, price polls and order calls reuse TCP/TLS connections
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self._session.headers.update({"Connection": "keep-alive"})
+
         # Initialize StandX clients
         self.http_client = StandXPerpHTTP(
             base_url=config.get("exchanges.standx.trade_url"),
             geo_url=config.get("exchanges.standx.geo_url")
         )
+        # Worker threads for sending several order requests at once (see place_orders_batch)
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="standx-orders")
+        # Route the client's calls through the shared session (plain attribute, so this
+        # also works with protocol module versions whose __init__ has no session parameter)
+        self.http_client.session = self._session
 
         # Initialize authentication
         private_key_str = config.get_solana_private_key()
@@ -83,8 +132,18 @@ class StandXMarketMaker:
         # Create StandXAuth for request signing (uses internal ed25519 key)
         self.auth = StandXAuth()
 
+        # Client order IDs: "<side>_<startup wall-clock ms>_<seq>" - the startup stamp keeps
+        # IDs unique across restarts, the counter keeps them unique within a run (the bid and
+        # ask of one batch are placed in the same millisecond)
+        self._cl_ord_base = int(time.time() * 1000)
+        self._cl_ord_seq = itertools.count()
+
+        # Set by SIGINT/SIGTERM (or stop()) to end run_strategy_loop; its waits wake on it
+        self._stop_event = threading.Event()
+
         # Authentication token
         self.token = None
+        self._login_lock = threading.Lock()
 
         # Track active orders
         self.active_orders: Dict[int, OrderInfo] = {}
@@ -114,38 +173,46 @@ class StandXMarketMaker:
             "signedMessage": list(msg_bytes)
         }
         complex_obj = {"input": input_data, "output": output_data}
-        json_str = json.dumps(complex_obj, separators=(',', ':'))
-        return base64.b64encode(json_str.encode('utf-8')).decode('utf-8')
+        return base64.b64encode(_json_dumps_bytes(complex_obj)).decode('utf-8')
 
-    def login(self) -> bool:
+    def login(self, force: bool = False) -> bool:
         """
         Login to StandX and get authentication token.
 
+        A still-valid token from the on-disk cache is reused without any network call.
+
+        Args:
+            force: Ignore the token cache and always sign in
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            import requests
-
             auth_url = self.config.get("exchanges.standx.auth_url")
             chain = self.config.get("exchanges.standx.chain", "solana")
 
+            if not force and not self.config.get("exchanges.standx.force_relogin", False):
+                token = load_cached_token(self.wallet_address, auth_url)
+                if token:
+                    self.token = token
+                    logger.info("StandX login skipped, using cached token")
+                    return True
+
             logger.info(f"Logging in to StandX with wallet {self.wallet_address[:10]}...")
 
             # 1. Prepare signin
-            resp = requests.post(
+            resp = self._session.post(
                 f"{auth_url}/v1/offchain/prepare-signin?chain={chain}",
                 json={"address": self.wallet_address, "requestId": str(self.keypair.pubkey())}
             )
             if not resp.ok:
                 raise Exception(f"Prepare failed: {resp.text}")
 
-            signed_data_jwt = resp.json()["signedData"]
+            signed_data_jwt = _json_loads(resp.content)["signedData"]
 
-            # 2. Sign message
-            parts = signed_data_jwt.split('.')
-            padded = parts[1] + '=' * (4 - len(parts[1]) % 4)
-            jwt_payload = json.loads(base64.b64decode(padded).decode('utf-8'))
+            # 2. Sign message (JWT segments are unpadded base64url)
+            payload_b64 = signed_data_jwt.split('.')[1]
+            jwt_payload = _json_loads(base64.urlsafe_b64decode(payload_b64 + '=' * (-len(payload_b64) % 4)))
             msg_bytes = jwt_payload.get("message").encode('utf-8')
             raw_sig = bytes(self.keypair.sign_message(msg_bytes))
 
@@ -153,25 +220,42 @@ class StandXMarketMaker:
             final_sig = self.construct_solana_signature(jwt_payload, raw_sig, msg_bytes)
 
             # 4. Login
-            resp = requests.post(
+            issued_at = time.time()
+            resp = self._session.post(
                 f"{auth_url}/v1/offchain/login?chain={chain}",
                 json={
                     "signature": final_sig,
                     "signedData": signed_data_jwt,
-                    "expiresSeconds": 604800
+                    "expiresSeconds": TOKEN_EXPIRES_SECONDS
                 }
             )
             if not resp.ok:
                 raise Exception(f"Login failed: {resp.text}")
 
-            self.token = resp.json().get("token")
+            self.token = _json_loads(resp.content).get("token")
+            if not self.token:
+                raise Exception("Login failed: no token in response")
             logger.info("Successfully logged in to StandX")
+            save_cached_token(self.token, self.wallet_address, auth_url, issued_at)
             return True
 
         except Exception as e:
             logger.error(f"Login failed: {e}")
             return False
 
+    def _handle_request_error(self, e: Exception):
+        """Re-login if the server rejected our token (StandXPerpHTTP raises 'HTTP 401: ...')"""
+        if not str(e).startswith("HTTP 401"):
+            return
+        rejected = self.token
+        # Bid and ask run concurrently and can both see the 401; sign in only once
+        with self._login_lock:
+            if self.token != rejected:
+                return
+            logger.warning("StandX token rejected, signing in again")
+            clear_cached_token()
+            self.login(force=True)
+
     def get_current_price(self) -> Optional[float]:
         """
         Get current market price for the symbol.
@@ -217,7 +301,7 @@ class StandXMarketMaker:
             OrderInfo if successful, None otherwise
         """
         try:
-            cl_ord_id = f"{side}_{int(time.time() * 1000)}"
+            cl_ord_id = f"{side}_{self._cl_ord_base}_{next(self._cl_ord_seq)}"
 
             response = self.http_client.place_order(
                 token=self.token,
@@ -250,8 +334,25 @@ class StandXMarketMaker:
 
         except Exception as e:
             logger.error(f"Failed to place {side} order: {e}")
+            self._handle_request_error(e)
             return None
 
+    def place_orders_batch(self, orders: List[Tuple[str, float]]) -> List[OrderInfo]:
+        """
+        Place several limit orders concurrently.
+
+        StandX has no batch order endpoint, so each order is still its own request,
+        but all requests are in flight together: one round trip instead of one per order.
+
+        Args:
+            orders: (side, price) pairs, e.g. [("buy", bid_price), ("sell", ask_price)]
+
+        Returns:
+            OrderInfo for each order that was placed (failed ones are omitted)
+        """
+        results = self._executor.map(lambda order: self.place_order(*order), orders)
+        return [order_info for order_info in results if order_info]
+
     def cancel_all_orders(self) -> bool:
         """
         Cancel all active orders.
@@ -278,6 +379,7 @@ class StandXMarketMaker:
 
         except Exception as e:
             logger.error(f"Failed to cancel orders: {e}")
+            self._handle_request_error(e)
             return False
 
     def sync_open_orders(self):
@@ -290,25 +392,36 @@ class StandXMarketMaker:
 
             result = open_orders_data.get("result", [])
 
-            # Update our tracking
-            new_active_orders = {}
+            # Update our tracking by diff: existing OrderInfo objects are kept (only qty can
+            # change for an order id), new ones are built only for orders we haven't seen
+            active = self.active_orders
+            incoming = set()
             for order_data in result:
                 order_id = order_data.get("id")
-                if order_id:
-                    order_info = OrderInfo(
-                        order_id=order_id,
-                        side=order_data.get("side"),
-                        price=float(order_data.get("price", 0)),
-                        qty=float(order_data.get("qty", 0)),
-                        cl_ord_id=order_data.get("cl_ord_id")
-                    )
-                    new_active_orders[order_id] = order_info
-
-            self.active_orders = new_active_orders
+                if not order_id:
+                    continue
+                incoming.add(order_id)
+                qty = float(order_data.get("qty", 0))
+                existing = active.get(order_id)
+                if existing is not None:
+                    existing.qty = qty
+                    continue
+                active[order_id] = OrderInfo(
+                    order_id=order_id,
+                    side=order_data.get("side"),
+                    price=float(order_data.get("price", 0)),
+                    qty=qty,
+                    cl_ord_id=order_data.get("cl_ord_id")
+                )
+
+            # Drop orders no longer open (including locally placed ones keyed by cl_ord_id)
+            for stale in active.keys() - incoming:
+                del active[stale]
             logger.debug(f"Synced {len(self.active_orders)} open orders")
 
         except Exception as e:
             logger.error(f"Failed to sync orders: {e}")
+            self._handle_request_error(e)
 
     def should_cancel_and_replace(self, current_price: float) -> bool:
         """
@@ -323,35 +436,51 @@ class StandXMarketMaker:
         if not self.active_orders:
             return True
 
+        # Integer tick compare: |diff| < ceil(threshold) is exact for integer diffs,
+        # equivalent to |diff| / price < cancel_threshold
+        current_ticks = _to_ticks(current_price)
+        threshold_ticks = math.ceil(current_ticks * self.cancel_threshold)
+
         # Check if any order is too close to current price
         for order in self.active_orders.values():
-            price_diff_pct = abs(order.price - current_price) / current_price
-
             # If order is within cancel threshold, cancel and replace
-            if price_diff_pct < self.cancel_threshold:
+            if abs(order.price_ticks - current_ticks) < threshold_ticks:
                 logger.info(f"Order at {order.price} too close to market {current_price}, will cancel")
                 return True
 
         return False
 
+    def stop(self, *_):
+        """Ask run_strategy_loop to exit (usable as a signal handler)"""
+        self._stop_event.set()
+
+    def _install_signal_handlers(self):
+        """Route SIGINT/SIGTERM to stop() (only possible from the main thread)"""
+        try:
+            signal.signal(signal.SIGINT, self.stop)
+            signal.signal(signal.SIGTERM, self.stop)
+        except ValueError:
+            logger.debug("Not in main thread, relying on KeyboardInterrupt for shutdown")
+
     def run_strategy_loop(self):
         """Main strategy loop"""
         logger.info("Starting market making strategy loop")
+        self._install_signal_handlers()
+        stop = self._stop_event
 
-        while True:
+        while not stop.is_set():
             try:
-                # Get current price
+                # Get current price and sync open orders concurrently (independent requests)
+                sync_done = self._executor.submit(self.sync_open_orders)
                 current_price = self.get_current_price()
+                sync_done.result()
                 if not current_price:
                     logger.warning("Could not get current price, retrying...")
-                    time.sleep(self.check_interval)
+                    stop.wait(self.check_interval)
                     continue
 
                 logger.info(f"Current price: {current_price}")
 
-                # Sync open orders
-                self.sync_open_orders()
-
                 # Check if we need to cancel and replace orders
                 if self.should_cancel_and_replace(current_price):
                     logger.info("Cancelling existing orders...")
@@ -362,28 +491,30 @@ class StandXMarketMaker:
 
                     logger.info(f"Placing new orders: Bid @ {bid_price}, Ask @ {ask_price}")
 
-                    # Place bid order
-                    bid_order = self.place_order("buy", bid_price)
-                    if bid_order:
-                        self.active_orders[bid_order.cl_ord_id] = bid_order
-
-                    # Place ask order
-                    ask_order = self.place_order("sell", ask_price)
-                    if ask_order:
-                        self.active_orders[ask_order.cl_ord_id] = ask_order
+                    # Place bid and ask together
+                    placed = self.place_orders_batch([("buy", bid_price), ("sell", ask_price)])
+                    self.active_orders.update((order.cl_ord_id, order) for order in placed)
 
-                    time.sleep(1)  # Brief pause between operations
+                    stop.wait(1)  # Brief pause between operations
 
-                # Wait for next check
-                time.sleep(self.check_interval)
+                # Wait for next check (returns early on stop)
+                stop.wait(self.check_interval)
 
             except KeyboardInterrupt:
-                logger.info("Received stop signal, cancelling all orders...")
-                self.cancel_all_orders()
+                # Only reached when signal handlers could not be installed
                 break
             except Exception as e:
                 logger.error(f"Error in strategy loop: {e}", exc_info=True)
-                time.sleep(self.check_interval)
+                stop.wait(self.check_interval)
+
+        logger.info("Received stop signal, cancelling all orders...")
+        self.cancel_all_orders()
+        self.close()
+
+    def close(self):
+        """Release pooled HTTP connections and order worker threads"""
+        self._executor.shutdown(wait=False)
+        self._session.close()
 
     def start(self):
         """Start the market making bot"""
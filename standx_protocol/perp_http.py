@@ -7,6 +7,21 @@ import json
 import time
 import uuid
 
+# Optional fast JSON codec: responses are parsed from the raw body bytes, request
+# payloads are encoded compactly (same text as json.dumps with compact separators
+# and ensure_ascii=False)
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
 
 class RegionResponse:
     """Region and server time response"""
@@ -18,16 +33,20 @@ class RegionResponse:
 class StandXPerpHTTP:
     """StandX Perps HTTP API Client"""
 
-    def __init__(self, base_url: str = "https://perps.standx.com", geo_url: str = "https://geo.standx.com"):
+    def __init__(self, base_url: str = "https://perps.standx.com", geo_url: str = "https://geo.standx.com",
+                 session: Optional[requests.Session] = None):
         """
         Initialize StandX Perps HTTP client.
 
         Args:
             base_url: Base URL for perps API (default: https://perps.standx.com)
             geo_url: Base URL for geo API (default: https://geo.standx.com)
+            session: Shared requests.Session for connection reuse (created if None)
         """
         self.base_url = base_url.rstrip('/')
         self.geo_url = geo_url.rstrip('/')
+        # Keep-alive session: reuses TCP/TLS connections across requests
+        self.session = session or requests.Session()
 
     def health_check(self) -> str:
         """
@@ -40,7 +59,7 @@ class StandXPerpHTTP:
             ValueError: If request fails
         """
         url = f"{self.base_url}/api/health"
-        response = requests.get(url)
+        response = self.session.get(url)
 
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -58,12 +77,12 @@ class StandXPerpHTTP:
             ValueError: If request fails
         """
         url = f"{self.geo_url}/v1/region"
-        response = requests.get(url, timeout=1.0)
+        response = self.session.get(url, timeout=1.0)
 
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
 
-        data = response.json()
+        data = _json_loads(response.content)
         region = RegionResponse(data)
         return region
 
@@ -108,12 +127,12 @@ class StandXPerpHTTP:
             "Authorization": f"Bearer {token}"
         }
 
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
 
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
 
-        return response.json()
+        return _json_loads(response.content)
 
     def place_order(
         self,
@@ -174,7 +193,7 @@ class StandXPerpHTTP:
         if leverage is not None:
             payload["leverage"] = leverage
 
-        payload_str = json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+        payload_str = _json_dumps(payload)
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {token}"
@@ -193,12 +212,12 @@ class StandXPerpHTTP:
         sign_headers = auth.sign_request(payload_str, request_id, timestamp)
         headers.update(sign_headers)
 
-        response = requests.post(url, headers=headers, data=payload_str)
+        response = self.session.post(url, headers=headers, data=payload_str)
 
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
 
-        return response.json()
+        return _json_loads(response.content)
 
     def query_positions(
         self,
@@ -237,12 +256,12 @@ class StandXPerpHTTP:
         if symbol:
             params["symbol"] = symbol
 
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
 
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
 
-        return response.json()
+        return _json_loads(response.content)
 
     def query_symbol_price(
         self,
@@ -273,12 +292,12 @@ class StandXPerpHTTP:
         url = f"{self.base_url}/api/query_symbol_price"
         params = {"symbol": symbol}
 
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params)
 
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
 
-        return response.json()
+        return _json_loads(response.content)
 
     def query_open_orders(
         self,
@@ -314,12 +333,12 @@ class StandXPerpHTTP:
         if limit:
             params["limit"] = limit
 
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
 
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
 
-        return response.json()
+        return _json_loads(response.content)
 
     def cancel_orders(
         self,
@@ -354,7 +373,7 @@ class StandXPerpHTTP:
         if cl_ord_id_list:
             payload["cl_ord_id_list"] = cl_ord_id_list
 
-        payload_str = json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+        payload_str = _json_dumps(payload)
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {token}"
@@ -369,9 +388,9 @@ class StandXPerpHTTP:
         sign_headers = auth.sign_request(payload_str, request_id, timestamp)
         headers.update(sign_headers)
 
-        response = requests.post(url, headers=headers, data=payload_str)
+        response = self.session.post(url, headers=headers, data=payload_str)
 
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
 
-        return response.json()
+        return _json_loads(response.content)
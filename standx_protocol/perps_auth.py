@@ -3,6 +3,7 @@ StandX Perps Authentication Module
 """
 import base64
 import json
+import logging
 import time
 from typing import Literal, Optional, Dict, Any, Callable
 from cryptography.hazmat.primitives.asymmetric import ed25519
@@ -11,8 +12,14 @@ import base58
 import requests
 
 
+logger = logging.getLogger(__name__)
+
 Chain = Literal["bsc", "solana"]
 
+# Request-signing scheme version; the signed message is "<version>,<request_id>,<timestamp>,<payload>"
+SIGN_VERSION = "v1"
+_SIGN_PREFIX = SIGN_VERSION + ","
+
 
 class SignedData:
     """Signed data structure from prepare-signin response"""
@@ -44,12 +51,13 @@ class LoginResponse:
 class StandXAuth:
     """StandX Authentication Client"""
 
-    def __init__(self, private_key: Optional[bytes] = None):
+    def __init__(self, private_key: Optional[bytes] = None, session: Optional[requests.Session] = None):
         """
         Initialize StandXAuth instance.
 
         Args:
             private_key: Optional 32-byte private key. If None, generates a new key pair.
+            session: Shared requests.Session for connection reuse (created if None)
         """
         if private_key:
             if len(private_key) != 32:
@@ -65,6 +73,8 @@ class StandXAuth:
         )
         self.request_id = base58.b58encode(self._public_key_bytes).decode('utf-8')
         self.base_url = "https://api.standx.com"
+        # Keep-alive session: prepare-signin and login reuse one TCP/TLS connection
+        self.session = session or requests.Session()
 
     def authenticate(
         self,
@@ -111,7 +121,7 @@ class StandXAuth:
             "requestId": self.request_id
         }
 
-        response = requests.post(
+        response = self.session.post(
             url,
             json=data,
             headers={"Content-Type": "application/json"}
@@ -156,7 +166,7 @@ class StandXAuth:
             "expiresSeconds": expires_seconds
         }
 
-        response = requests.post(
+        response = self.session.post(
             url,
             json=data,
             headers={"Content-Type": "application/json"}
@@ -185,24 +195,22 @@ class StandXAuth:
         Returns:
             Dictionary with signature headers
         """
-        version = "v1"
-        message = f"{version},{request_id},{timestamp},{payload}"
+        message = f"{_SIGN_PREFIX}{request_id},{timestamp},{payload}"
         message_bytes = message.encode('utf-8')
 
         signature = self._private_key.sign(message_bytes)
-        signature_b64 = base64.b64encode(signature).decode('utf-8')
+        signature_b64 = base64.b64encode(signature).decode('ascii')
 
-        # Debug logging
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.debug(f"Sign Request Debug:")
-        logger.debug(f"  Timestamp (ms): {timestamp}")
-        logger.debug(f"  Request ID: {request_id}")
-        logger.debug(f"  Payload: {payload}")
-        logger.debug(f"  Message to sign: {message[:100]}...")
+        # Debug logging (called per order/cancel, so skip the formatting unless enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sign Request Debug:")
+            logger.debug("  Timestamp (ms): %s", timestamp)
+            logger.debug("  Request ID: %s", request_id)
+            logger.debug("  Payload: %s", payload)
+            logger.debug("  Message to sign: %.100s...", message)
 
         return {
-            "x-request-sign-version": version,
+            "x-request-sign-version": SIGN_VERSION,
             "x-request-id": request_id,
             "x-request-timestamp": str(timestamp),
             "x-request-signature": signature_b64
@@ -222,16 +230,10 @@ class StandXAuth:
         if len(parts) != 3:
             raise ValueError("Invalid JWT format")
 
-        # Decode base64url
+        # Decode base64url, adding padding if needed
         base64_url = parts[1]
-        base64_str = base64_url.replace('-', '+').replace('_', '/')
-        # Add padding if needed
-        padding = len(base64_str) % 4
-        if padding:
-            base64_str += '=' * (4 - padding)
-
-        decoded = base64.b64decode(base64_str)
-        return json.loads(decoded.decode('utf-8'))
+        decoded = base64.urlsafe_b64decode(base64_url + '=' * (-len(base64_url) % 4))
+        return json.loads(decoded)
 
     def export_private_key(self) -> bytes:
         """Export private key as bytes"""
@@ -32,7 +32,22 @@ class OrderState(Enum):
     CANCELLED = auto()      # Cancelled
 
 
-@dataclass
+# Per-state permission bits (the whole lifecycle policy in one table)
+PERM_PLACE = 1   # May place new market making orders
+PERM_CANCEL = 2  # May cancel orders
+PERM_CHECK = 4   # Should run order check logic
+
+STATE_PERMISSIONS: Dict[BotState, int] = {
+    BotState.IDLE: PERM_PLACE,
+    BotState.PLACING: 0,  # PLACING_TIMEOUT may still allow placing, see can_place_orders
+    BotState.MARKET_MAKING: PERM_PLACE | PERM_CANCEL | PERM_CHECK,
+    BotState.CANCELLING: 0,
+    BotState.HEDGING: 0,  # Never cancel during hedging
+    BotState.CLOSING: PERM_CANCEL,
+}
+
+
+@dataclass(slots=True)
 class TrackedOrder:
     """Track individual order state"""
     cl_ord_id: str
@@ -43,7 +58,7 @@ class TrackedOrder:
     filled_qty: Decimal = Decimal('0')
     state: OrderState = OrderState.PENDING
     is_close_order: bool = False
-    created_at: float = field(default_factory=time.time)
+    created_at: int = field(default_factory=time.monotonic_ns)  # monotonic ns, immune to clock jumps
 
     @property
     def remaining_qty(self) -> Decimal:
@@ -64,10 +79,14 @@ class StateMachine:
     PLACING_TIMEOUT = 10
     # Timeout for CANCELLING state (seconds)
     CANCELLING_TIMEOUT = 10
+    # Same timeouts in ns: state ages are tracked with time.monotonic_ns()
+    PLACING_TIMEOUT_NS = PLACING_TIMEOUT * 1_000_000_000
+    CANCELLING_TIMEOUT_NS = CANCELLING_TIMEOUT * 1_000_000_000
 
     def __init__(self):
         self._state = BotState.IDLE
         self._previous_state = BotState.IDLE
+        self._perms = STATE_PERMISSIONS[self._state]  # Permission bits of the current state
 
         # Order tracking by cl_ord_id
         self._orders: Dict[str, TrackedOrder] = {}
@@ -78,8 +97,12 @@ class StateMachine:
         self._pending_mm_orders: Set[str] = set()  # Market making orders
         self._pending_cancel_orders: Set[str] = set()  # Orders being cancelled
 
-        # State transition timestamp
-        self._state_changed_at = time.time()
+        # Indexes kept in step with order states (see _index_order) for O(1) queries
+        self._open_mm_ids: Set[str] = set()  # Non-close orders in OPEN state
+        self._live_close_ids: Dict[str, None] = {}  # Close orders PENDING/OPEN, insertion-ordered
+
+        # State transition timestamp (time.monotonic_ns(), unaffected by wall-clock/NTP jumps)
+        self._state_changed_at = time.monotonic_ns()
 
         logger.info(f"StateMachine initialized, state={self._state.name}")
 
@@ -96,35 +119,36 @@ class StateMachine:
         if new_state != self._state:
             self._previous_state = self._state
             self._state = new_state
-            self._state_changed_at = time.time()
+            self._perms = STATE_PERMISSIONS[new_state]
+            self._state_changed_at = time.monotonic_ns()
             logger.info(f"State: {self._previous_state.name} -> {new_state.name}")
 
+    def _state_age_ns(self) -> int:
+        """Nanoseconds since last state change"""
+        return time.monotonic_ns() - self._state_changed_at
+
     def _state_age(self) -> float:
         """Seconds since last state change"""
-        return time.time() - self._state_changed_at
+        return self._state_age_ns() / 1e9
 
     # ========== State Query Methods ==========
 
     def can_place_orders(self) -> bool:
         """Check if we can place new market making orders"""
-        if self._state == BotState.PLACING:
-            # Check timeout
-            if self._state_age() > self.PLACING_TIMEOUT:
-                logger.warning("PLACING state timeout, allowing new orders")
-                return True
-            return False
-        return self._state in (BotState.IDLE, BotState.MARKET_MAKING)
+        if self._perms & PERM_PLACE:
+            return True
+        if self._state == BotState.PLACING and self._state_age_ns() > self.PLACING_TIMEOUT_NS:
+            logger.warning("PLACING state timeout, allowing new orders")
+            return True
+        return False
 
     def can_cancel_orders(self) -> bool:
         """Check if we can cancel orders"""
-        # Never cancel during hedging
-        if self._state == BotState.HEDGING:
-            return False
-        return self._state in (BotState.MARKET_MAKING, BotState.CLOSING)
+        return bool(self._perms & PERM_CANCEL)
 
     def can_check_orders(self) -> bool:
         """Check if we should run order check logic"""
-        return self._state == BotState.MARKET_MAKING
+        return bool(self._perms & PERM_CHECK)
 
     def is_hedging(self) -> bool:
         return self._state == BotState.HEDGING
@@ -134,6 +158,19 @@ class StateMachine:
 
     # ========== Order Tracking Methods ==========
 
+    def _index_order(self, order: TrackedOrder):
+        """Update the state indexes after an order is tracked or changes state"""
+        cl_ord_id = order.cl_ord_id
+        if order.is_close_order:
+            if order.state in (OrderState.PENDING, OrderState.OPEN):
+                self._live_close_ids[cl_ord_id] = None
+            else:
+                self._live_close_ids.pop(cl_ord_id, None)
+        elif order.state == OrderState.OPEN:
+            self._open_mm_ids.add(cl_ord_id)
+        else:
+            self._open_mm_ids.discard(cl_ord_id)
+
     def track_order(self, cl_ord_id: str, side: str, price: Decimal,
                     quantity: Decimal, is_close_order: bool = False) -> TrackedOrder:
         """Start tracking a new order"""
@@ -145,6 +182,7 @@ class StateMachine:
             is_close_order=is_close_order
         )
         self._orders[cl_ord_id] = order
+        self._index_order(order)
         logger.debug(f"Tracking order: {cl_ord_id} {side} {quantity}@{price}")
         return order
 
@@ -163,9 +201,8 @@ class StateMachine:
 
     def get_close_order(self) -> Optional[TrackedOrder]:
         """Get the current close order if any"""
-        for order in self._orders.values():
-            if order.is_close_order and order.state in (OrderState.PENDING, OrderState.OPEN):
-                return order
+        for cl_ord_id in self._live_close_ids:
+            return self._orders[cl_ord_id]
         return None
 
     def remove_order(self, cl_ord_id: str):
@@ -174,13 +211,18 @@ class StateMachine:
             order = self._orders.pop(cl_ord_id)
             if order.order_id and order.order_id in self._order_id_map:
                 del self._order_id_map[order.order_id]
+            self._open_mm_ids.discard(cl_ord_id)
+            self._live_close_ids.pop(cl_ord_id, None)
             logger.debug(f"Removed order: {cl_ord_id}")
 
     # ========== State Transition Methods ==========
 
-    def on_placing_orders(self, cl_ord_ids: list):
-        """Called when starting to place market making orders"""
-        self._pending_mm_orders = set(cl_ord_ids)
+    def on_placing_orders(self, cl_ord_ids: Set[str]):
+        """
+        Called when starting to place market making orders.
+        Takes ownership of the set (confirmations are removed from it); other iterables are copied.
+        """
+        self._pending_mm_orders = cl_ord_ids if isinstance(cl_ord_ids, set) else set(cl_ord_ids)
         self._set_state(BotState.PLACING)
 
     def on_order_confirmed(self, cl_ord_id: str, order_id: str):
@@ -190,6 +232,7 @@ class StateMachine:
             order.order_id = order_id
             order.state = OrderState.OPEN
             self._order_id_map[order_id] = cl_ord_id
+            self._index_order(order)
 
         # Remove from pending
         self._pending_mm_orders.discard(cl_ord_id)
@@ -210,16 +253,21 @@ class StateMachine:
             order.state = OrderState.FILLED
         else:
             order.state = OrderState.PARTIAL_FILLED
+        self._index_order(order)
 
         return order
 
-    def on_cancelling_orders(self, cl_ord_ids: list):
-        """Called when starting to cancel orders"""
-        self._pending_cancel_orders = set(cl_ord_ids)
+    def on_cancelling_orders(self, cl_ord_ids: Set[str]):
+        """
+        Called when starting to cancel orders.
+        Takes ownership of the set (confirmations are removed from it); other iterables are copied.
+        """
+        self._pending_cancel_orders = cl_ord_ids if isinstance(cl_ord_ids, set) else set(cl_ord_ids)
         for cl_ord_id in cl_ord_ids:
             order = self._orders.get(cl_ord_id)
             if order:
                 order.state = OrderState.CANCELLING
+                self._index_order(order)
         self._set_state(BotState.CANCELLING)
 
     def on_order_cancelled(self, order_id: str):
@@ -273,13 +321,9 @@ class StateMachine:
 
     # ========== Utility Methods ==========
 
-    def get_orders_to_cancel(self) -> list:
-        """Get cl_ord_ids of orders that can be cancelled (excludes close orders)"""
-        result = []
-        for cl_ord_id, order in self._orders.items():
-            if not order.is_close_order and order.state == OrderState.OPEN:
-                result.append(cl_ord_id)
-        return result
+    def get_orders_to_cancel(self) -> Set[str]:
+        """Get cl_ord_ids of orders that can be cancelled (excludes close orders), as a new set"""
+        return self._open_mm_ids.copy()
 
     def clear_all(self):
         """Clear all tracking (for reset)"""
@@ -287,6 +331,8 @@ class StateMachine:
         self._order_id_map.clear()
         self._pending_mm_orders.clear()
         self._pending_cancel_orders.clear()
+        self._open_mm_ids.clear()
+        self._live_close_ids.clear()
         self._set_state(BotState.IDLE)
 
     def get_status(self) -> dict:
@@ -13,12 +13,24 @@ from dotenv import load_dotenv
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import event_loop
 from lighter_client import LighterHedger
 from config_loader import Config
 
 # Load environment variables
 load_dotenv()
 
+# Hedge sizes and position check tolerance (BTC)
+HEDGE1_QTY = Decimal('0.001')
+HEDGE2_QTY = Decimal('0.002')
+POSITION_TOLERANCE = Decimal('0.0001')
+
+# Re-read the position from the API after the hedges instead of using the one place_hedge_order verified
+VERIFY_REMOTE = "--verify-remote" in sys.argv
+
+# Upper bound (seconds) for both concurrent hedges to finish, so a stalled request cannot hang the test
+HEDGE_TIMEOUT = float(os.getenv("HEDGE_TEST_TIMEOUT", "30"))
+
 
 async def test_concurrent_hedges():
     """Test concurrent hedge operations with lock protection."""
@@ -70,43 +82,78 @@ async def test_concurrent_hedges():
         # Launch two concurrent hedge operations
         print("Launching concurrent hedge operations...")
 
+        hedge1_locked = asyncio.Event()
         hedge1 = asyncio.create_task(
-            lighter.place_hedge_order('buy', Decimal('0.001'))
+            lighter.place_hedge_order('buy', HEDGE1_QTY, lock_acquired=hedge1_locked)
         )
 
-        # Small delay to ensure first hedge starts first
-        await asyncio.sleep(0.05)
+        # Launch the second hedge only once the first holds the lock
+        # (if hedge 1 exits before locking, e.g. hedging disabled, don't wait forever)
+        locked_waiter = asyncio.create_task(hedge1_locked.wait())
+        await asyncio.wait([locked_waiter, hedge1], return_when=asyncio.FIRST_COMPLETED)
+        locked_waiter.cancel()
 
         hedge2 = asyncio.create_task(
-            lighter.place_hedge_order('buy', Decimal('0.002'))
+            lighter.place_hedge_order('buy', HEDGE2_QTY)
         )
 
-        # Wait for both to complete
-        results = await asyncio.gather(hedge1, hedge2, return_exceptions=True)
+        # Wait for both to complete (bounded by HEDGE_TIMEOUT)
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(hedge1, hedge2, return_exceptions=True),
+                timeout=HEDGE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            print(f"\n❌ Hedges did not finish within {HEDGE_TIMEOUT}s, cancelling")
+            hedge1.cancel()
+            hedge2.cancel()
+            # Drain without a timeout so the cancellations are fully processed
+            await asyncio.gather(hedge1, hedge2, return_exceptions=True)
+            await lighter.disconnect()
+            return False
 
-        print("\n" + "=" * 80)
-        print("Results")
-        print("=" * 80)
+        # Report is collected here and written in one go before cleanup, so it doesn't
+        # interleave with the hedge-lock log output and survives a failing cleanup
+        report = [
+            "\n" + "=" * 80,
+            "Results",
+            "=" * 80,
+        ]
 
         success_count = sum(1 for r in results if r is True)
-        print(f"\nHedge 1 (BUY 0.001): {'✓ Success' if results[0] is True else '✗ Failed'}")
-        print(f"Hedge 2 (BUY 0.002): {'✓ Success' if results[1] is True else '✗ Failed'}")
+        report.append(f"\nHedge 1 (BUY {HEDGE1_QTY}): {'✓ Success' if results[0] is True else '✗ Failed'}")
+        report.append(f"Hedge 2 (BUY {HEDGE2_QTY}): {'✓ Success' if results[1] is True else '✗ Failed'}")
 
-        # Check final position
-        final_position = await lighter.get_position()
-        expected_position = initial_position + Decimal('0.003')
+        # Check final position: place_hedge_order already polled the position to confirm
+        # each fill and stored it in current_position, so only re-read it on request
+        if VERIFY_REMOTE:
+            final_position = await lighter.get_position()
+        else:
+            final_position = lighter.current_position
+        expected_position = initial_position + HEDGE1_QTY + HEDGE2_QTY
         position_diff = abs(final_position - expected_position)
 
-        print(f"\nPosition Summary:")
-        print(f"  Initial:  {initial_position} BTC")
-        print(f"  Expected: {expected_position} BTC (+0.003)")
-        print(f"  Actual:   {final_position} BTC")
-        print(f"  Diff:     {position_diff} BTC")
-
-        if position_diff < Decimal('0.0001'):
-            print("\n✅ Position is CORRECT - Lock worked!")
+        # Tolerance check in integer base-amount units (at least 1 unit, i.e. exact match
+        # when the market has fewer size decimals than the tolerance)
+        base_mul = lighter.base_amount_multiplier
+        tol_units = max(int(POSITION_TOLERANCE * base_mul), 1)
+        position_ok = abs(int(final_position * base_mul) - int(expected_position * base_mul)) < tol_units
+
+        report += [
+            f"\nPosition Summary:",
+            f"  Initial:  {initial_position} BTC",
+            f"  Expected: {expected_position} BTC (+{HEDGE1_QTY + HEDGE2_QTY})",
+            f"  Actual:   {final_position} BTC",
+            f"  Diff:     {position_diff} BTC",
+        ]
+
+        if position_ok:
+            report.append("\n✅ Position is CORRECT - Lock worked!")
         else:
-            print("\n⚠️  Position mismatch - Possible issue")
+            report.append("\n⚠️  Position mismatch - Possible issue")
+
+        sys.stdout.write("\n".join(report) + "\n")
+        sys.stdout.flush()
 
         # Clean up - close the position
         if final_position != initial_position:
@@ -130,7 +177,7 @@ async def test_concurrent_hedges():
         print("✅ Test completed!")
         print("=" * 80)
 
-        return success_count == 2 and position_diff < Decimal('0.0001')
+        return success_count == 2 and position_ok
 
     except Exception as e:
         print(f"\n❌ Error during test: {e}")
@@ -176,14 +223,16 @@ if __name__ == "__main__":
     print("\n⚠️  WARNING: This test will place real orders on Lighter!")
     print("   Make sure you have sufficient balance.")
 
-    response = input("\nProceed with test? (yes/no): ")
-    if response.lower() != 'yes':
-        print("Test cancelled.")
-        sys.exit(0)
+    # HEDGE_TEST_YES=1 skips the confirmation prompt (non-interactive/CI runs)
+    if os.getenv("HEDGE_TEST_YES") != "1":
+        response = input("\nProceed with test? (yes/no): ")
+        if response.lower() != 'yes':
+            print("Test cancelled.")
+            sys.exit(0)
 
-    result = asyncio.run(test_concurrent_hedges())
+    result = event_loop.run(test_concurrent_hedges())
 
     if result:
-        asyncio.run(test_lock_serialization())
+        event_loop.run(test_lock_serialization())
 
     exit(0 if result else 1)
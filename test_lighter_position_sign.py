@@ -6,14 +6,55 @@ This will help us understand if position.position is signed correctly.
 
 import asyncio
 import os
+import time
 from decimal import Decimal
+from itertools import count
 from dotenv import load_dotenv
+
+import event_loop
 from lighter import SignerClient, ApiClient, Configuration
 import lighter
+from test_lighter_price import get_market
 
 # Load environment variables
 load_dotenv()
 
+# Client order indexes: ms-seeded counter, unique even for orders sent within the same ms
+_order_id = count(time.time_ns() // 1_000_000 % 1_000_000)
+
+ZERO = Decimal('0')
+BUY_SLIPPAGE = Decimal('1.05')
+SELL_SLIPPAGE = Decimal('0.95')
+
+FILL_POLL_INTERVAL = 0.05  # seconds
+FILL_TIMEOUT = 5.0  # seconds
+
+
+async def wait_for_fill(get_position, baseline: Decimal, target_abs: Decimal,
+                        timeout: float = FILL_TIMEOUT):
+    """
+    Poll the position until it has moved by at least target_abs from baseline.
+
+    The direction is not checked here, so an inverted side shows up as soon as
+    it fills instead of only after the timeout.
+
+    Args:
+        get_position: Async callable returning the current position
+        baseline: Position before the order
+        target_abs: Absolute position change expected from the fill
+        timeout: Maximum seconds to wait
+
+    Returns:
+        Tuple of (last position read, seconds waited)
+    """
+    start = time.monotonic()
+    while True:
+        await asyncio.sleep(FILL_POLL_INTERVAL)
+        position = await get_position()
+        elapsed = time.monotonic() - start
+        if abs(position - baseline) >= target_abs or elapsed >= timeout:
+            return position, elapsed
+
 
 async def test_position_sign():
     """Test position sign after buy and sell orders."""
@@ -47,13 +88,7 @@ async def test_position_sign():
 
         # Get market configuration for BTC
         order_api = lighter.OrderApi(api_client)
-        order_books = await order_api.order_books()
-
-        btc_market = None
-        for market in order_books.order_books:
-            if market.symbol == "BTC":
-                btc_market = market
-                break
+        btc_market = await get_market(order_api, "BTC")
 
         if not btc_market:
             print("❌ BTC market not found")
@@ -63,8 +98,8 @@ async def test_position_sign():
         print(f"  Market ID: {btc_market.market_id}")
         print(f"  Symbol: {btc_market.symbol}")
 
-        base_amount_multiplier = pow(10, btc_market.supported_size_decimals)
-        price_multiplier = pow(10, btc_market.supported_price_decimals)
+        base_amount_multiplier = btc_market.base_amount_multiplier
+        price_multiplier = btc_market.price_multiplier
 
         # Function to get current position
         async def get_position():
@@ -73,19 +108,19 @@ async def test_position_sign():
                 value=str(account_index)
             )
             if not account_data or not account_data.accounts:
-                return Decimal('0')
+                return ZERO
 
-            for position in account_data.accounts[0].positions:
-                if position.market_id == btc_market.market_id:
-                    return Decimal(str(position.position))
-            return Decimal('0')
+            positions_by_market = {p.market_id: p for p in account_data.accounts[0].positions}
+            position = positions_by_market.get(btc_market.market_id)
+            return Decimal(str(position.position)) if position else ZERO
 
-        # Get initial position
-        initial_position = await get_position()
+        # Get initial position and current orderbook (independent requests, fetched concurrently)
+        initial_position, orderbook = await asyncio.gather(
+            get_position(),
+            order_api.order_book_orders(market_id=btc_market.market_id, limit=5),
+        )
         print(f"\n✓ Initial Position: {initial_position} BTC")
 
-        # Get current orderbook
-        orderbook = await order_api.order_book_orders(market_id=btc_market.market_id, limit=5)
         best_bid = Decimal(str(orderbook.bids[0].price))
         best_ask = Decimal(str(orderbook.asks[0].price))
 
@@ -99,14 +134,14 @@ async def test_position_sign():
         print("=" * 80)
 
         buy_quantity = Decimal('0.001')  # Very small amount
-        buy_price = int(best_ask * Decimal('1.05') * price_multiplier)
+        buy_price = int(best_ask * BUY_SLIPPAGE * price_multiplier)
 
         print(f"\n  Placing BUY order: {buy_quantity} BTC")
         print(f"  is_ask=False (this should INCREASE position)")
 
         tx, tx_hash, err = await lighter_client.create_market_order(
             market_index=btc_market.market_id,
-            client_order_index=int(asyncio.get_event_loop().time() * 1000) % 1000000,
+            client_order_index=next(_order_id) % 1_000_000,
             base_amount=int(buy_quantity * base_amount_multiplier),
             avg_execution_price=buy_price,
             is_ask=False,
@@ -117,9 +152,8 @@ async def test_position_sign():
             return False
 
         print(f"  ✓ Order submitted, waiting for fill...")
-        await asyncio.sleep(1.5)
-
-        position_after_buy = await get_position()
+        position_after_buy, waited = await wait_for_fill(get_position, initial_position, buy_quantity)
+        print(f"  Position update seen after {waited:.2f}s")
         buy_change = position_after_buy - initial_position
 
         print(f"\n  Position before: {initial_position}")
@@ -138,14 +172,14 @@ async def test_position_sign():
         print("=" * 80)
 
         sell_quantity = buy_quantity
-        sell_price = int(best_bid * Decimal('0.95') * price_multiplier)
+        sell_price = int(best_bid * SELL_SLIPPAGE * price_multiplier)
 
         print(f"\n  Placing SELL order: {sell_quantity} BTC")
         print(f"  is_ask=True (this should DECREASE position)")
 
         tx, tx_hash, err = await lighter_client.create_market_order(
             market_index=btc_market.market_id,
-            client_order_index=int(asyncio.get_event_loop().time() * 1000) % 1000000,
+            client_order_index=next(_order_id) % 1_000_000,
             base_amount=int(sell_quantity * base_amount_multiplier),
             avg_execution_price=sell_price,
             is_ask=True,
@@ -156,9 +190,8 @@ async def test_position_sign():
             return False
 
         print(f"  ✓ Order submitted, waiting for fill...")
-        await asyncio.sleep(1.5)
-
-        position_after_sell = await get_position()
+        position_after_sell, waited = await wait_for_fill(get_position, position_after_buy, sell_quantity)
+        print(f"  Position update seen after {waited:.2f}s")
         sell_change = position_after_sell - position_after_buy
 
         print(f"\n  Position before: {position_after_buy}")
@@ -206,5 +239,5 @@ async def test_position_sign():
 
 
 if __name__ == "__main__":
-    result = asyncio.run(test_position_sign())
+    result = event_loop.run(test_position_sign())
     exit(0 if result else 1)
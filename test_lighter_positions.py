@@ -5,9 +5,12 @@ Test script for Lighter position fetching
 import os
 import asyncio
 import logging
+import traceback
 from decimal import Decimal
 from dotenv import load_dotenv
 
+import event_loop
+
 # Load environment variables
 load_dotenv()
 
@@ -67,11 +70,20 @@ async def test_lighter_positions():
         logger.info(f"  - Base Multiplier: {lighter.base_amount_multiplier}")
         logger.info(f"  - Price Multiplier: {lighter.price_multiplier}")
 
-        # Test _fetch_positions (internal method)
-        logger.info("\n5. 测试 _fetch_positions() 内部方法...")
+        # Steps 5-7 all read the same account, derive them from one snapshot request
         try:
-            positions = await lighter._fetch_positions()
-            logger.info(f"✓ _fetch_positions() 调用成功")
+            snapshot = await lighter.get_account_snapshot()
+            positions, position, balance = snapshot["positions"], snapshot["position"], snapshot["balance"]
+        except Exception as e:
+            positions = position = balance = e
+
+        # Positions list
+        logger.info("\n5. 测试仓位列表 (account snapshot)...")
+        if isinstance(positions, Exception):
+            logger.error(f"❌ get_account_snapshot() 调用失败: {positions}")
+            logger.error("".join(traceback.format_exception(positions)))
+        else:
+            logger.info(f"✓ get_account_snapshot() 调用成功")
             logger.info(f"  - 返回的仓位数量: {len(positions)}")
 
             if positions:
@@ -84,37 +96,26 @@ async def test_lighter_positions():
             else:
                 logger.info("  - 当前没有持仓")
 
-        except Exception as e:
-            logger.error(f"❌ _fetch_positions() 调用失败: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-
-        # Test get_position (public method)
-        logger.info("\n6. 测试 get_position() 公共方法...")
-        try:
-            position = await lighter.get_position()
-            logger.info(f"✓ get_position() 调用成功")
+        # Position for our market
+        logger.info("\n6. 测试当前市场仓位 (account snapshot)...")
+        if isinstance(position, Exception):
+            logger.error(f"❌ 仓位解析失败: {position}")
+            logger.error("".join(traceback.format_exception(position)))
+        else:
+            logger.info(f"✓ 仓位解析成功")
             logger.info(f"  - 当前仓位: {position}")
             logger.info(f"  - 仓位类型: {'多头' if position > 0 else '空头' if position < 0 else '无仓位'}")
 
-        except Exception as e:
-            logger.error(f"❌ get_position() 调用失败: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-
-        # Test get_balance
-        logger.info("\n7. 测试 get_balance() 方法...")
-        try:
-            balance = await lighter.get_balance()
-            logger.info(f"✓ get_balance() 调用成功")
+        # Balance
+        logger.info("\n7. 测试余额 (account snapshot)...")
+        if isinstance(balance, Exception):
+            logger.error(f"❌ 余额解析失败: {balance}")
+            logger.error("".join(traceback.format_exception(balance)))
+        else:
+            logger.info(f"✓ 余额解析成功")
             logger.info(f"  - 总余额: {balance.get('balance', 0)}")
             logger.info(f"  - 可用余额: {balance.get('available', 0)}")
 
-        except Exception as e:
-            logger.error(f"❌ get_balance() 调用失败: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-
         # Disconnect
         logger.info("\n8. 断开连接...")
         await lighter.disconnect()
@@ -126,8 +127,7 @@ async def test_lighter_positions():
 
     except Exception as e:
         logger.error(f"\n❌ 测试过程中出现错误: {e}")
-        import traceback
         logger.error(traceback.format_exc())
 
 if __name__ == "__main__":
-    asyncio.run(test_lighter_positions())
+    event_loop.run(test_lighter_positions())
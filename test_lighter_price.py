@@ -6,21 +6,81 @@ Test script to verify Lighter price calculation logic.
 import asyncio
 import os
 from decimal import Decimal
+from types import SimpleNamespace
 from dotenv import load_dotenv
-from lighter import SignerClient, ApiClient, Configuration
+
+import event_loop
+from lighter import ApiClient, Configuration
 import lighter
 
 # Load environment variables
 load_dotenv()
 
+# In-process market metadata cache: order_books() is static within a session, so it is
+# fetched once per process (one base_url per run) and shared by every test using get_market
+_MARKET_FIELDS = ("market_id", "symbol", "supported_size_decimals", "supported_price_decimals")
+_market_cache = {}
+
+
+def _market_entry(market_id, symbol, supported_size_decimals, supported_price_decimals):
+    """Build a cache entry with the size/price multipliers computed once"""
+    return SimpleNamespace(
+        market_id=market_id,
+        symbol=symbol,
+        supported_size_decimals=supported_size_decimals,
+        supported_price_decimals=supported_price_decimals,
+        base_amount_multiplier=10 ** supported_size_decimals,
+        price_multiplier=10 ** supported_price_decimals,
+    )
+
+
+async def get_market(order_api, symbol: str):
+    """
+    Get market metadata by symbol, fetching order_books() only on the first call.
+
+    Args:
+        order_api: lighter.OrderApi instance
+        symbol: Market symbol (e.g., "BTC")
+
+    Returns:
+        Market metadata (market_id, symbol, supported_*_decimals, base_amount_multiplier,
+        price_multiplier), None if not found
+    """
+    if symbol not in _market_cache:
+        order_books = await order_api.order_books()
+        _market_cache.update({
+            m.symbol: _market_entry(*(getattr(m, name) for name in _MARKET_FIELDS))
+            for m in order_books.order_books
+        })
+
+    return _market_cache.get(symbol)
+
+
+def scale_price(price_str: str, decimals: int, num: int, den: int) -> int:
+    """
+    Scale a decimal price string to integer price units and apply a slippage ratio,
+    using integer arithmetic only (same result as int(Decimal(price) * num / den * 10**decimals)
+    for prices with at most `decimals` fractional digits).
+
+    Args:
+        price_str: Price as returned by the API (e.g., "97123.4")
+        decimals: Market supported_price_decimals
+        num: Slippage numerator (e.g., 95 for -5%)
+        den: Slippage denominator (e.g., 100)
+
+    Returns:
+        Price in integer units of 10**-decimals, truncated
+    """
+    whole, _, frac = price_str.partition('.')
+    raw = int(whole + frac[:decimals].ljust(decimals, '0'))
+    return (raw * num) // den
+
 
 async def test_price_calculation():
     """Test price calculation for market orders."""
 
     # Get credentials from environment
     api_key_private_key = os.getenv('API_KEY_PRIVATE_KEY')
-    account_index = int(os.getenv('LIGHTER_ACCOUNT_INDEX', '0'))
-    api_key_index = int(os.getenv('LIGHTER_API_KEY_INDEX', '0'))
     base_url = "https://mainnet.zklighter.elliot.ai"
 
     print("=" * 80)
@@ -32,26 +92,12 @@ async def test_price_calculation():
         return False
 
     try:
-        # Initialize Lighter client
-        api_private_keys = {api_key_index: api_key_private_key}
-        lighter_client = SignerClient(
-            url=base_url,
-            account_index=account_index,
-            api_private_keys=api_private_keys,
-        )
-
-        # Create API client
+        # Create API client (read-only endpoints only, no SignerClient needed)
         api_client = ApiClient(configuration=Configuration(host=base_url))
 
         # Get market configuration for BTC
         order_api = lighter.OrderApi(api_client)
-        order_books = await order_api.order_books()
-
-        btc_market = None
-        for market in order_books.order_books:
-            if market.symbol == "BTC":
-                btc_market = market
-                break
+        btc_market = await get_market(order_api, "BTC")
 
         if not btc_market:
             print("❌ BTC market not found")
@@ -63,8 +109,8 @@ async def test_price_calculation():
         print(f"  Supported Size Decimals: {btc_market.supported_size_decimals}")
         print(f"  Supported Price Decimals: {btc_market.supported_price_decimals}")
 
-        base_amount_multiplier = pow(10, btc_market.supported_size_decimals)
-        price_multiplier = pow(10, btc_market.supported_price_decimals)
+        base_amount_multiplier = btc_market.base_amount_multiplier
+        price_multiplier = btc_market.price_multiplier
 
         print(f"  Base Amount Multiplier: {base_amount_multiplier}")
         print(f"  Price Multiplier: {price_multiplier}")
@@ -107,25 +153,25 @@ async def test_price_calculation():
 
         # Method 1: Current implementation (WRONG?)
         slippage_multiplier_1 = Decimal('0.95')
-        avg_execution_price_1 = int(expected_price * slippage_multiplier_1 * price_multiplier)
+        avg_execution_price_1 = scale_price(best_bid_str, btc_market.supported_price_decimals, 95, 100)
 
         print(f"\n  Method 1 (Current Implementation):")
         print(f"    Slippage Multiplier: {slippage_multiplier_1}")
-        print(f"    Calculation: int({expected_price} * {slippage_multiplier_1} * {price_multiplier})")
+        print(f"    Calculation: int({expected_price} * {slippage_multiplier_1} * {price_multiplier}) (integer-scaled)")
         print(f"    avg_execution_price: {avg_execution_price_1}")
         print(f"    Represents Price: ${avg_execution_price_1 / price_multiplier:,.2f}")
 
         # Method 2: SDK style (remove decimal point first)
         price_int = int(best_bid_str.replace(".", ""))
         slippage_multiplier_2 = 0.95
-        avg_execution_price_2 = round(price_int * slippage_multiplier_2)
+        avg_execution_price_2 = (price_int * 95 + 50) // 100  # Integer round-half-up, no float error
 
         print(f"\n  Method 2 (SDK Style - remove decimal point):")
         print(f"    Price String: '{best_bid_str}'")
         print(f"    After removing '.': '{best_bid_str.replace('.', '')}'")
         print(f"    Price Int: {price_int}")
         print(f"    Slippage Multiplier: {slippage_multiplier_2}")
-        print(f"    Calculation: round({price_int} * {slippage_multiplier_2})")
+        print(f"    Calculation: round({price_int} * {slippage_multiplier_2}) (integer arithmetic)")
         print(f"    avg_execution_price: {avg_execution_price_2}")
 
         # Try to figure out what price this represents
@@ -152,25 +198,25 @@ async def test_price_calculation():
 
         # Method 1: Current implementation
         slippage_multiplier_1 = Decimal('1.05')
-        avg_execution_price_1 = int(expected_price * slippage_multiplier_1 * price_multiplier)
+        avg_execution_price_1 = scale_price(best_ask_str, btc_market.supported_price_decimals, 105, 100)
 
         print(f"\n  Method 1 (Current Implementation):")
         print(f"    Slippage Multiplier: {slippage_multiplier_1}")
-        print(f"    Calculation: int({expected_price} * {slippage_multiplier_1} * {price_multiplier})")
+        print(f"    Calculation: int({expected_price} * {slippage_multiplier_1} * {price_multiplier}) (integer-scaled)")
         print(f"    avg_execution_price: {avg_execution_price_1}")
         print(f"    Represents Price: ${avg_execution_price_1 / price_multiplier:,.2f}")
 
         # Method 2: SDK style
         price_int = int(best_ask_str.replace(".", ""))
         slippage_multiplier_2 = 1.05
-        avg_execution_price_2 = round(price_int * slippage_multiplier_2)
+        avg_execution_price_2 = (price_int * 105 + 50) // 100  # Integer round-half-up, no float error
 
         print(f"\n  Method 2 (SDK Style - remove decimal point):")
         print(f"    Price String: '{best_ask_str}'")
         print(f"    After removing '.': '{best_ask_str.replace('.', '')}'")
         print(f"    Price Int: {price_int}")
         print(f"    Slippage Multiplier: {slippage_multiplier_2}")
-        print(f"    Calculation: round({price_int} * {slippage_multiplier_2})")
+        print(f"    Calculation: round({price_int} * {slippage_multiplier_2}) (integer arithmetic)")
         print(f"    avg_execution_price: {avg_execution_price_2}")
 
         print(f"\n  Trying to decode Method 2 price:")
@@ -207,5 +253,5 @@ async def test_price_calculation():
 
 
 if __name__ == "__main__":
-    result = asyncio.run(test_price_calculation())
+    result = event_loop.run(test_price_calculation())
     exit(0 if result else 1)